@@ -0,0 +1,180 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from MazeGenerator import MazeGenerator
+from DynamicMaze import DynamicMaze
+from PathFinder import PathFinder
+from SeedTree import SeedTree
+from Pawn import Pawn
+
+# The sizes of the square mazes the benchmarks run on by default.
+SIZES = (12, 50, 100, 250, 500, 1000)
+
+def generateMaze(rows, cols, seed):
+    """
+    Returns a function that generates a new maze with Prim's algorithm, so
+    every call times a full generation.
+    """
+    def call():
+        MazeGenerator(rows, cols, 'prim', SeedTree(seed).generator()).generateMaze()
+    return call
+
+def converToGraph(rows, cols, seed):
+    """
+    Returns a function that converts a generated maze to a graph. The maze
+    keeps its graph until its walls change, so the walls are marked as
+    changed before every conversion to time a full build and not a cache hit.
+    """
+    maze = MazeGenerator(rows, cols, 'prim', SeedTree(seed).generator()).generateMaze()
+    def call():
+        maze.walls.markChanged()
+        maze.converToGraph()
+    return call
+
+def getPathMapping(rows, cols, seed):
+    """
+    Returns a function that runs A* from corner to corner on the graph of a
+    generated maze. The graph stays the same, so this times the search alone.
+    """
+    maze = MazeGenerator(rows, cols, 'prim', SeedTree(seed).generator()).generateMaze()
+    pathFinder = PathFinder(maze.converToGraph(), (0, 0), (rows - 1, cols - 1))
+    return pathFinder.getPathMapping
+
+def findPath(rows, cols, seed):
+    """
+    Returns a function that finds the path of a pawn from corner to corner,
+    including the conversion of its maze to a graph, as after a wall change.
+    """
+    maze = MazeGenerator(rows, cols, 'prim', SeedTree(seed).generator()).generateMaze()
+    pawn = Pawn((0, 0), (rows - 1, cols - 1), maze)
+    def call():
+        maze.walls.markChanged()
+        pawn.findPath()
+    return call
+
+def updateMaze(rows, cols, seed, updateFactor=5):
+    """
+    Returns a function that runs one tick of a dynamic maze, so consecutive
+    calls time consecutive ticks of the same run.
+    """
+    dynamicMaze = DynamicMaze(rows, cols, seed=seed)
+    return lambda: dynamicMaze.updateMaze(updateFactor)
+
+# The benchmarks by name. A benchmark sets up its inputs for a maze size and a
+# seed, outside of the timing, and returns the function that is timed.
+BENCHMARKS = {
+    'generateMaze': generateMaze,
+    'converToGraph': converToGraph,
+    'getPathMapping': getPathMapping,
+    'findPath': findPath,
+    'updateMaze': updateMaze,
+}
+
+def runBenchmark(name, size, seed, repeats):
+    """
+    Times a benchmark on a square maze.
+
+    The function of the benchmark is called once to warm up, once under
+    tracemalloc to measure the peak memory it allocates, and then repeats
+    times without tracing to measure its latency.
+
+    Args:
+        name (str): The name of the benchmark in BENCHMARKS.
+        size (int): The number of rows and columns of the maze.
+        seed (int): The seed of the maze.
+        repeats (int): The number of timed calls.
+
+    Returns:
+        dict: The median and the 95th percentile of the latency in seconds and the peak memory in bytes.
+    """
+    call = BENCHMARKS[name](size, size, seed)
+    call()
+
+    tracemalloc.start()
+    call()
+    peakMemory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times = np.empty(repeats)
+    for i in range(repeats):
+        startTime = time.perf_counter()
+        call()
+        times[i] = time.perf_counter() - startTime
+    return {
+        'benchmark': name,
+        'size': size,
+        'repeats': repeats,
+        'median': float(np.median(times)),
+        'p95': float(np.percentile(times, 95)),
+        'peakMemory': peakMemory,
+    }
+
+def compare(results, baseline, threshold):
+    """
+    Compares the median latencies of the results with a baseline.
+
+    Args:
+        results (list): The results of this run.
+        baseline (list): The results of the baseline run.
+        threshold (float): The relative slowdown above which a result is a regression.
+
+    Returns:
+        list: The regressions as (benchmark, size, baseline median, median) tuples.
+    """
+    baselineMedians = {(result['benchmark'], result['size']): result['median'] for result in baseline}
+    regressions = []
+    for result in results:
+        baselineMedian = baselineMedians.get((result['benchmark'], result['size']))
+        if baselineMedian is not None and result['median'] > baselineMedian * (1 + threshold):
+            regressions.append((result['benchmark'], result['size'], baselineMedian, result['median']))
+    return regressions
+
+if __name__ == "__main__":
+    # Parse command-line arguments.
+    parser = argparse.ArgumentParser(description='Dynamic Maze Benchmarks')
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS), help='Benchmarks to run')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES), help='Numbers of rows and columns of the square mazes')
+    parser.add_argument('--repeats', type=int, default=15, help='Number of timed calls per benchmark and size')
+    parser.add_argument('--seed', type=int, default=1, help='Seed of the mazes')
+    parser.add_argument('--output', default='benchmark.json', help='JSON file the results are written to')
+    parser.add_argument('--baseline', default=None, help='JSON file of an earlier run to compare the medians with')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Relative slowdown of a median that counts as a regression')
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<16} {'size':>6} {'median ms':>12} {'p95 ms':>12} {'peak KiB':>12}")
+    results = []
+    for name in args.benchmarks:
+        for size in args.sizes:
+            result = runBenchmark(name, size, args.seed, args.repeats)
+            results.append(result)
+            print(f"{name:<16} {size:>6} {result['median'] * 1e3:>12.3f} {result['p95'] * 1e3:>12.3f} "
+                  f"{result['peakMemory'] / 1024:>12.1f}", flush=True)
+
+    with open(args.output, 'w') as file:
+        json.dump({
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.platform(),
+            'seed': args.seed,
+            'results': results,
+        }, file, indent=2)
+    print(f"Results written to {args.output}.")
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for name, size, baselineMedian, median in regressions:
+            print(f"Regression: {name} at {size}x{size} took {median * 1e3:.3f} ms, "
+                  f"{median / baselineMedian - 1:.0%} more than the baseline {baselineMedian * 1e3:.3f} ms.")
+        if regressions:
+            sys.exit(1)
+        print(f"No median is more than {args.threshold:.0%} slower than the baseline.")
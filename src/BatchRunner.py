@@ -0,0 +1,166 @@
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from MazeGenerator import MazeGenerator
+from DynamicMaze import DynamicMaze
+from SeedTree import SeedTree
+from Simulation import Simulation
+
+def runEpisode(episode):
+    """
+    Runs one episode headless. It is a module level function so that worker
+    processes can unpickle it.
+
+    Args:
+        episode (tuple): The episode index, its SeedTree node and the options of the Simulation.
+
+    Returns:
+        dict: The result of the episode.
+    """
+    index, seedTree, options = episode
+    startTime = time.perf_counter()
+    simulation = Simulation(seed=seedTree, **options)
+    reachedGoal = simulation.runUntilGoal()
+    dynamicMaze = simulation.dynamicMaze
+    return {
+        'episode': index,
+        'seed': seedTree.seed,
+        'streamOffset': seedTree.offset,
+        'reachedGoal': reachedGoal,
+        'ticks': simulation.ticks,
+        'pathLength': sum(pawn.move_history.totalMoves for pawn in dynamicMaze.pawns),
+        'replansPerformed': dynamicMaze.replansPerformed,
+        'replansSkipped': dynamicMaze.replansSkipped,
+        'wallTime': time.perf_counter() - startTime,
+    }
+
+class BatchRunner:
+    """
+    This class runs many independent maze episodes across a process pool.
+
+    Every episode gets its own part of the random number stream of the root
+    seed, so an episode does not depend on which worker runs it or when. The
+    parts must hold every number an episode draws, so the number of episodes
+    is limited by the size of the mazes and the number of ticks. The
+    episodes are handed to the workers in chunks, and the results come back
+    in episode order. Apart from the measured wall time, the results are the
+    same for any number of workers.
+
+    Attributes:
+        episodes (int): The number of episodes.
+        seedTree (SeedTree): The root of the random number streams of the episodes.
+        workers (int): The number of worker processes, 1 to run in this process.
+        chunkSize (int): The number of episodes handed to a worker at once.
+        options (dict): The options of the Simulation of every episode.
+
+    Methods:
+        __init__(self, episodes, seed=None, workers=None, chunkSize=16, **options): Initializes a BatchRunner object.
+        results(self): Runs the episodes and yields their results in episode order.
+        run(self, path=None): Runs the episodes and writes the results to a JSONL or CSV file as they arrive.
+    """
+
+    FIELDS = ('episode', 'seed', 'streamOffset', 'reachedGoal', 'ticks', 'pathLength',
+              'replansPerformed', 'replansSkipped', 'wallTime')
+
+    def __init__(self, episodes, seed=None, workers=None, chunkSize=16, **options):
+        """
+        Initializes a BatchRunner object.
+
+        Args:
+            episodes (int): The number of episodes.
+            seed (int): The root seed of the batch. If None, a random seed is chosen.
+            workers (int): The number of worker processes. Default is None, which uses one per CPU.
+            chunkSize (int): The number of episodes handed to a worker at once. Default is 16.
+            **options: The options of the Simulation of every episode, such as rows, cols,
+                pawnSpeed, updateFactor and maxTicks.
+        """
+        assert episodes >= 0, "The number of episodes should be non-negative."
+        self.episodes = episodes
+        self.seedTree = SeedTree(seed)
+        # Every episode must be able to draw its maze, its pawns and all of its ticks from its own stream.
+        # Without a tick limit only the maze and the pawns are covered, and an episode that runs out raises.
+        budget = DynamicMaze.drawBudget(options.get('rows', 12), options.get('cols', 12), options.get('generator', 'prim'),
+                                        options.get('pawns', 1), max(0, options.get('updateFactor', 5)),
+                                        options.get('maxTicks') or 0)
+        assert episodes == 0 or self.seedTree.length // episodes >= budget, \
+            f"The stream of an episode should hold {budget} values, but {episodes} episodes leave " \
+            f"{self.seedTree.length // max(1, episodes)}. Run fewer episodes or fewer ticks per episode."
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunkSize = max(1, chunkSize)
+        self.options = options
+
+    def results(self):
+        """
+        Runs the episodes and yields their results in episode order.
+
+        Yields:
+            dict: The result of the next episode.
+        """
+        episodes = ((i, seedTree, self.options) for i, seedTree in enumerate(self.seedTree.split(self.episodes)))
+        if self.workers <= 1:
+            yield from map(runEpisode, episodes)
+            return
+        with ProcessPoolExecutor(self.workers) as executor:
+            yield from executor.map(runEpisode, episodes, chunksize=self.chunkSize)
+
+    def run(self, path=None):
+        """
+        Runs the episodes and writes the results to a file as they arrive. A
+        path ending in .csv is written as CSV, anything else as JSON lines.
+
+        Args:
+            path (str): The path of the file. Default is None, which does not write a file.
+
+        Returns:
+            list: The results of the episodes in episode order.
+        """
+        results = []
+        if path is None:
+            results.extend(self.results())
+            return results
+
+        with open(path, 'w', newline='') as file:
+            if path.endswith('.csv'):
+                writer = csv.DictWriter(file, fieldnames=BatchRunner.FIELDS)
+                writer.writeheader()
+                write = writer.writerow
+            else:
+                write = lambda result: file.write(json.dumps(result) + '\n')
+            for result in self.results():
+                write(result)
+                file.flush()
+                results.append(result)
+        return results
+
+if __name__ == "__main__":
+    # Parse command-line arguments.
+    parser = argparse.ArgumentParser(description='Dynamic Maze Batch Runner')
+    parser.add_argument('--episodes', type=int, default=100, help='Number of episodes')
+    parser.add_argument('--seed', type=int, default=None, help='Root seed of the batch, random if not given')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes, one per CPU if not given')
+    parser.add_argument('--chunkSize', type=int, default=16, help='Number of episodes handed to a worker at once')
+    parser.add_argument('--output', default='results.jsonl', help='Output file, CSV if it ends in .csv and JSON lines otherwise')
+    parser.add_argument('--rows', type=int, default=12, help='Number of rows in the maze')
+    parser.add_argument('--cols', type=int, default=12, help='Number of columns in the maze')
+    parser.add_argument('--pawnSpeed', type=float, default=0.33333, help='Speed of the pawn')
+    parser.add_argument('--updateFactor', type=int, default=5, help='Factor of the updates')
+    parser.add_argument('--planner', choices=['astar', 'incremental', 'field'], default='astar', help='Path planner of the pawn')
+    parser.add_argument('--generator', choices=list(MazeGenerator.ALGORITHMS), default='prim', help='Maze generation algorithm')
+    parser.add_argument('--updateMode', choices=list(DynamicMaze.UPDATE_MODES), default='sequential', help='Apply and replan after every wall change, or apply all changes of an update at once')
+    parser.add_argument('--pawns', type=int, default=1, help='Number of pawns per episode')
+    parser.add_argument('--maxTicks', type=int, default=10000, help='Maximum number of updates per episode')
+    args = parser.parse_args()
+
+    batchRunner = BatchRunner(args.episodes, args.seed, args.workers, args.chunkSize,
+                              rows=args.rows, cols=args.cols, pawnSpeed=args.pawnSpeed, updateFactor=args.updateFactor,
+                              planner=args.planner, generator=args.generator, updateMode=args.updateMode,
+                              maxTicks=args.maxTicks, pawns=args.pawns)
+    startTime = time.perf_counter()
+    results = batchRunner.run(args.output)
+    elapsed = time.perf_counter() - startTime
+    reached = sum(result['reachedGoal'] for result in results)
+    print(f"Ran {len(results)} episodes (seed {batchRunner.seedTree.seed}) in {elapsed:.3f} s, "
+          f"{reached} reached the goal. Results written to {args.output}.")
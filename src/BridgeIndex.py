@@ -0,0 +1,187 @@
+from collections import deque
+from Maze import Maze
+from WallGrid import WallGrid
+
+class BridgeIndex:
+    """
+    Class that keeps track of the bridges of a maze, the open passages whose
+    closing would split the maze into two parts.
+
+    The bridges are found once with Tarjan's algorithm. After that the index
+    holds the passages known to be bridges: every passage in it is a bridge,
+    so checking one of them is an O(1) lookup. Opening a passage removes the
+    known bridges that now lie on a cycle, and closing a known bridge removes
+    it. Closing any other passage can turn passages of its two-edge-connected
+    component into bridges, but finding them would mean searching the whole
+    component again, which is most of the maze once walls have been changing
+    for a while. Instead, a passage that is not known to be a bridge is
+    checked when it is asked about, with a bidirectional breadth-first search
+    between its two ends that stops as soon as the two sides meet or one side
+    runs out, so it costs about twice the size of the smaller side. A passage
+    found to be a bridge this way is added to the index.
+
+    Attributes:
+        maze (Maze): The maze whose passages are indexed.
+        bridges (WallGrid): The passages of the maze that are known to be bridges.
+
+    Methods:
+        __init__(self, maze): Initializes a BridgeIndex object.
+        isBridge(self, wall): Checks if the passage where a wall would go is a bridge.
+        notifyWallChange(self, wall): Updates the known bridges after a wall is added or removed.
+    """
+
+    def __init__(self, maze : Maze):
+        """
+        Initializes a BridgeIndex object and finds all bridges of the maze.
+
+        Args:
+            maze (Maze): The maze whose passages are indexed.
+        """
+        self.maze = maze
+        self.bridges = WallGrid(maze.getRows(), maze.getCols())
+        self.__findBridges(range(maze.getRows() * maze.getCols()))
+
+    def isBridge(self, wall):
+        """
+        Checks if the open passage where a wall would go is a bridge.
+
+        Args:
+            wall (tuple): The wall to check.
+
+        Returns:
+            bool: True if adding the wall would disconnect the maze, False otherwise.
+        """
+        if wall in self.bridges:
+            return True
+        indexOf_a = self.maze.findIndexOfVertex(wall[0])
+        indexOf_b = self.maze.findIndexOfVertex(wall[1])
+        if indexOf_a < 0 or indexOf_b < 0:
+            return False
+        if self.__findPath(indexOf_a, indexOf_b) is not None:
+            return False
+        self.bridges.append(wall)
+        return True
+
+    def notifyWallChange(self, wall):
+        """
+        Updates the known bridges after a wall is added or removed.
+
+        Args:
+            wall (tuple): The wall that changed.
+        """
+        indexOf_a = self.maze.findIndexOfVertex(wall[0])
+        indexOf_b = self.maze.findIndexOfVertex(wall[1])
+        if indexOf_a < 0 or indexOf_b < 0:
+            return
+        if self.maze.hasWall(wall):
+            # A closed passage is no bridge. The other known bridges stay bridges.
+            if wall in self.bridges:
+                self.bridges.remove(wall)
+        else:
+            self.__passageOpened(wall, indexOf_a, indexOf_b)
+
+    def __passageOpened(self, wall, indexOf_a, indexOf_b):
+        """
+        Updates the known bridges after a passage is opened. The bridges on a
+        path between the two ends of the passage now lie on a cycle with it and
+        stop being bridges. Every such bridge lies on all of these paths, so any
+        one path finds them. If there was no such path, the new passage is a bridge.
+
+        Args:
+            wall (tuple): The opened passage.
+            indexOf_a (int): The index of one end of the passage.
+            indexOf_b (int): The index of the other end of the passage.
+        """
+        path = self.__findPath(indexOf_a, indexOf_b)
+        if path is None:
+            self.bridges.append(wall)
+            return
+
+        vertices = self.maze.vertices
+        for indexOf_v, indexOf_u in zip(path, path[1:]):
+            passage = (vertices[indexOf_v], vertices[indexOf_u])
+            if passage in self.bridges:
+                self.bridges.remove(passage)
+
+    def __findPath(self, indexOf_a, indexOf_b):
+        """
+        Finds a path between the two ends of a passage that does not use the
+        passage itself, with a bidirectional breadth-first search. The side
+        with fewer visited vertices is expanded first, and the search stops as
+        soon as the two sides meet or one side runs out.
+
+        Args:
+            indexOf_a (int): The index of one end of the passage.
+            indexOf_b (int): The index of the other end of the passage.
+
+        Returns:
+            list: The indices of the vertices on the path from a to b, or None if
+            the passage is the only connection between them.
+        """
+        getNeighborIndices = self.maze.getNeighborIndices
+        # The parent of every visited vertex on each side, -1 for the two ends.
+        parentsFromA, parentsFromB = {indexOf_a: -1}, {indexOf_b: -1}
+        frontierFromA, frontierFromB = deque([indexOf_a]), deque([indexOf_b])
+        while frontierFromA and frontierFromB:
+            if len(parentsFromA) <= len(parentsFromB):
+                frontier, parents, other = frontierFromA, parentsFromA, parentsFromB
+            else:
+                frontier, parents, other = frontierFromB, parentsFromB, parentsFromA
+            indexOf_v = frontier.popleft()
+            for indexOf_u in getNeighborIndices(indexOf_v):
+                if (indexOf_v, indexOf_u) in ((indexOf_a, indexOf_b), (indexOf_b, indexOf_a)):
+                    continue
+                if indexOf_u in other:
+                    # Join the branch of v and the branch of u at the step between them.
+                    branch, otherBranch = [], []
+                    while indexOf_v >= 0:
+                        branch.append(indexOf_v)
+                        indexOf_v = parents[indexOf_v]
+                    while indexOf_u >= 0:
+                        otherBranch.append(indexOf_u)
+                        indexOf_u = other[indexOf_u]
+                    path = branch[::-1] + otherBranch
+                    return path if path[0] == indexOf_a else path[::-1]
+                if indexOf_u not in parents:
+                    parents[indexOf_u] = indexOf_v
+                    frontier.append(indexOf_u)
+        return None
+
+    def __findBridges(self, roots):
+        """
+        Finds the bridges reachable from the given vertices with an iterative
+        version of Tarjan's algorithm and adds them to the index.
+
+        Args:
+            roots (iterable): The indices of the vertices to start from.
+        """
+        vertices = self.maze.vertices
+        getNeighborIndices = self.maze.getNeighborIndices
+        # disc -> discovery time, low -> earliest discovery time reachable without the parent passage.
+        disc = {}
+        low = {}
+        time = 0
+        for root in roots:
+            if root in disc:
+                continue
+            disc[root] = low[root] = time
+            time += 1
+            stack = [(root, -1, iter(getNeighborIndices(root)))]
+            while stack:
+                indexOf_v, indexOf_parent, neighbors = stack[-1]
+                for indexOf_u in neighbors:
+                    if indexOf_u == indexOf_parent:
+                        continue
+                    if indexOf_u in disc:
+                        low[indexOf_v] = min(low[indexOf_v], disc[indexOf_u])
+                    else:
+                        disc[indexOf_u] = low[indexOf_u] = time
+                        time += 1
+                        stack.append((indexOf_u, indexOf_v, iter(getNeighborIndices(indexOf_u))))
+                        break
+                else:
+                    stack.pop()
+                    if indexOf_parent >= 0:
+                        low[indexOf_parent] = min(low[indexOf_parent], low[indexOf_v])
+                        if low[indexOf_v] > disc[indexOf_parent]:
+                            self.bridges.append((vertices[indexOf_parent], vertices[indexOf_v]))
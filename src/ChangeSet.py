@@ -0,0 +1,227 @@
+class ChangeSet:
+    """
+    This class records what changed in a dynamic maze during one tick, so a
+    renderer can redraw only the affected cells instead of the whole maze.
+
+    Pawns are identified by their position in the pawn list of the maze.
+    Path steps are stored as (pawn, low, high), with the vertex indices of
+    the two ends of the step. A step that is added and removed again within
+    the same tick cancels out. When a move history with a capacity drops its
+    oldest position, the step from it to the next kept position leaves the
+    history and is recorded as a dropped history step.
+
+    Attributes:
+        tick (int): The number of the tick the changes belong to.
+        walls (list): The toggled walls in the order they changed.
+        pawnMoves (list): The moves of the pawns as (pawn, old index, new index).
+        historyDrops (list): The steps dropped from the move histories as (pawn, dropped index, next index).
+        addedPathSteps (set): The steps that were added to the paths of the pawns.
+        removedPathSteps (set): The steps that were removed from the paths of the pawns.
+
+    Methods:
+        __init__(self, tick=0): Initializes a ChangeSet object.
+        recordWall(self, wall): Records a toggled wall.
+        recordPawnMove(self, oldIndex, newIndex, pawn=0): Records a move of a pawn along its path.
+        recordPathChange(self, oldPath, newPath, pawn=0): Records that the path of a pawn was replaced.
+        recordHistoryDrop(self, droppedIndex, nextIndex, pawn=0): Records that a move history dropped its oldest position.
+        getOldPawnCell(self, pawn=0): Returns the index of the cell a pawn started the tick on.
+        getNewPawnCell(self, pawn=0): Returns the index of the cell a pawn ended the tick on.
+        pathChanged(self): Checks if the path of any pawn changed.
+        pawnChanged(self, pawn): Checks if a pawn moved or its path changed.
+        isEmpty(self): Checks if nothing changed.
+        dirtyCells(self, cols): Returns the indices of the cells whose drawing changed.
+    """
+
+    def __init__(self, tick=0):
+        """
+        Initializes a ChangeSet object.
+
+        Args:
+            tick (int): The number of the tick the changes belong to. Default is 0.
+        """
+        self.tick = tick
+        self.walls = []
+        self.pawnMoves = []
+        self.historyDrops = []
+        self.addedPathSteps = set()
+        self.removedPathSteps = set()
+
+    @staticmethod
+    def __step(pawn, indexOf_a, indexOf_b):
+        """
+        Returns the step of a pawn between two vertex indices in the order (pawn, low, high).
+
+        Args:
+            pawn (int): The pawn.
+            indexOf_a (int): The index of one end of the step.
+            indexOf_b (int): The index of the other end of the step.
+
+        Returns:
+            tuple: The step.
+        """
+        return (pawn, indexOf_a, indexOf_b) if indexOf_a < indexOf_b else (pawn, indexOf_b, indexOf_a)
+
+    def __addPathStep(self, step):
+        """
+        Records a step that joined the path, cancelling an earlier removal of it.
+
+        Args:
+            step (tuple): The step.
+        """
+        if step in self.removedPathSteps:
+            self.removedPathSteps.discard(step)
+        else:
+            self.addedPathSteps.add(step)
+
+    def __removePathStep(self, step):
+        """
+        Records a step that left the path, cancelling an earlier addition of it.
+
+        Args:
+            step (tuple): The step.
+        """
+        if step in self.addedPathSteps:
+            self.addedPathSteps.discard(step)
+        else:
+            self.removedPathSteps.add(step)
+
+    def recordWall(self, wall):
+        """
+        Records a toggled wall.
+
+        Args:
+            wall (tuple): The wall that was added or removed.
+        """
+        self.walls.append(wall)
+
+    def recordPawnMove(self, oldIndex, newIndex, pawn=0):
+        """
+        Records a move of a pawn along its path. The step leaves the path and
+        joins the move history.
+
+        Args:
+            oldIndex (int): The index of the cell the pawn left.
+            newIndex (int): The index of the cell the pawn moved to.
+            pawn (int): The pawn. Default is 0.
+        """
+        self.pawnMoves.append((pawn, oldIndex, newIndex))
+        self.__removePathStep(ChangeSet.__step(pawn, oldIndex, newIndex))
+
+    def recordPathChange(self, oldPath, newPath, pawn=0):
+        """
+        Records that the path of a pawn was replaced. Only the steps that
+        differ between the two paths are recorded.
+
+        Args:
+            oldPath (list): The old path as a list or an array of indices, or None.
+            newPath (list): The new path as a list or an array of indices, or None.
+            pawn (int): The pawn. Default is 0.
+        """
+        oldPath = list(map(int, oldPath)) if oldPath is not None else []
+        newPath = list(map(int, newPath)) if newPath is not None else []
+        oldSteps = {ChangeSet.__step(pawn, a, b) for a, b in zip(oldPath, oldPath[1:])}
+        newSteps = {ChangeSet.__step(pawn, a, b) for a, b in zip(newPath, newPath[1:])}
+        for step in oldSteps - newSteps:
+            self.__removePathStep(step)
+        for step in newSteps - oldSteps:
+            self.__addPathStep(step)
+
+    def recordHistoryDrop(self, droppedIndex, nextIndex, pawn=0):
+        """
+        Records that the move history of a pawn dropped its oldest position.
+
+        Args:
+            droppedIndex (int): The index of the cell of the dropped position.
+            nextIndex (int): The index of the cell of the position after it, now the oldest kept one.
+            pawn (int): The pawn. Default is 0.
+        """
+        self.historyDrops.append((pawn, droppedIndex, nextIndex))
+
+    def getOldPawnCell(self, pawn=0):
+        """
+        Returns the index of the cell a pawn started the tick on.
+
+        Args:
+            pawn (int): The pawn. Default is 0.
+
+        Returns:
+            int: The index of the cell, or None if the pawn did not move.
+        """
+        moves = [move for move in self.pawnMoves if move[0] == pawn]
+        return moves[0][1] if moves else None
+
+    def getNewPawnCell(self, pawn=0):
+        """
+        Returns the index of the cell a pawn ended the tick on.
+
+        Args:
+            pawn (int): The pawn. Default is 0.
+
+        Returns:
+            int: The index of the cell, or None if the pawn did not move.
+        """
+        moves = [move for move in self.pawnMoves if move[0] == pawn]
+        return moves[-1][2] if moves else None
+
+    def pathChanged(self):
+        """
+        Checks if the path of any pawn changed.
+
+        Returns:
+            bool: True if a step was added to or removed from a path.
+        """
+        return bool(self.addedPathSteps or self.removedPathSteps)
+
+    def pawnChanged(self, pawn):
+        """
+        Checks if a pawn moved or its path changed.
+
+        Args:
+            pawn (int): The pawn.
+
+        Returns:
+            bool: True if the drawing of the pawn changed.
+        """
+        return (any(move[0] == pawn for move in self.pawnMoves) or
+                any(drop[0] == pawn for drop in self.historyDrops) or
+                any(step[0] == pawn for step in self.addedPathSteps) or
+                any(step[0] == pawn for step in self.removedPathSteps))
+
+    def isEmpty(self):
+        """
+        Checks if nothing changed.
+
+        Returns:
+            bool: True if no wall was toggled, no pawn moved and no path or move history changed.
+        """
+        return not (self.walls or self.pawnMoves or self.historyDrops or self.pathChanged())
+
+    def dirtyCells(self, cols):
+        """
+        Returns the indices of the cells whose drawing changed: the cells on both
+        sides of every toggled wall, the cells the pawns moved between, the ends
+        of every dropped history step and the ends of every path step that changed.
+
+        Args:
+            cols (int): The number of columns of the maze.
+
+        Returns:
+            set: The indices of the cells.
+        """
+        cells = set()
+        for (a, b) in self.walls:
+            cells.add(a[0] * cols + a[1])
+            cells.add(b[0] * cols + b[1])
+        for (_, a, b) in self.pawnMoves:
+            cells.add(a)
+            cells.add(b)
+        for (_, a, b) in self.historyDrops:
+            cells.add(a)
+            cells.add(b)
+        for (_, a, b) in self.addedPathSteps:
+            cells.add(a)
+            cells.add(b)
+        for (_, a, b) in self.removedPathSteps:
+            cells.add(a)
+            cells.add(b)
+        return cells
@@ -0,0 +1,260 @@
+from array import array
+from collections import deque
+import heapq
+import numpy as np
+from Maze import Maze
+
+class DistanceField:
+    """
+    Class representing the distance of every vertex of a maze to a fixed goal.
+
+    The field is computed once with a reverse breadth-first search from the
+    goal and then kept up to date when walls are added or removed, so
+    a path from any position is found by greedy descent in O(path length).
+    Any number of pawns with the same goal can share one field. The distances
+    are stored in an array('i') that the NumPy array of the field shares, so
+    the updates read and write plain ints instead of indexing NumPy element by
+    element. A closed passage whose lost shortest paths reach more than
+    RECOMPUTE_FRACTION of the vertices is handled by computing the field from
+    scratch, which is faster than repairing most of it.
+
+    Attributes:
+        maze (Maze): The maze the distances are measured in.
+        goal (tuple): The goal vertex.
+        distances (numpy.ndarray): int32 array of shape (rows, cols) with the
+            number of steps to the goal, or UNREACHABLE.
+
+    Methods:
+        __init__(self, maze, goal): Initializes a DistanceField object.
+        compute(self): Computes the field from scratch.
+        getDistance(self, v): Returns the distance of a vertex to the goal.
+        notifyWallChange(self, wall): Updates the field after a wall is added or removed.
+        notifyWallChanges(self, removed, added): Updates the field once after several walls are added or removed.
+        getPath(self, start): Returns the shortest path from a vertex to the goal.
+    """
+
+    UNREACHABLE = -1
+    RECOMPUTE_FRACTION = 0.05
+
+    def __init__(self, maze : Maze, goal : tuple):
+        """
+        Initializes a DistanceField object and computes the field.
+
+        Args:
+            maze (Maze): The maze the distances are measured in.
+            goal (tuple): The goal vertex.
+        """
+        self.maze = maze
+        self.goal = goal
+        self.compute()
+
+    def compute(self):
+        """
+        Computes the field from scratch with a breadth-first search from the goal.
+        """
+        graph = self.maze.converToGraph()
+        offsets, neighbors = graph.getAdjacencyLists()
+
+        distances = [DistanceField.UNREACHABLE] * len(offsets[:-1])
+        indexOf_r = self.maze.findIndexOfVertex(self.goal)
+        distances[indexOf_r] = 0
+        queue = deque([indexOf_r])
+        while queue:
+            indexOf_v = queue.popleft()
+            d = distances[indexOf_v] + 1
+            for indexOf_u in neighbors[offsets[indexOf_v]:offsets[indexOf_v + 1]]:
+                if distances[indexOf_u] == DistanceField.UNREACHABLE:
+                    distances[indexOf_u] = d
+                    queue.append(indexOf_u)
+
+        self.__flat = array('i', distances)
+        self.distances = np.frombuffer(self.__flat, dtype=np.intc).reshape(self.maze.getRows(), self.maze.getCols())
+
+    def getDistance(self, v):
+        """
+        Returns the distance of a vertex to the goal.
+
+        Args:
+            v (tuple): The coordinates of the vertex.
+
+        Returns:
+            int: The number of steps to the goal, or UNREACHABLE.
+        """
+        return int(self.distances[v[0], v[1]])
+
+    def notifyWallChange(self, wall):
+        """
+        Updates the field after a wall is added or removed. Only the vertices
+        whose distance changes are visited.
+
+        Args:
+            wall (tuple): The wall that changed.
+        """
+        if self.maze.hasWall(wall):
+            self.notifyWallChanges((), (wall,))
+        else:
+            self.notifyWallChanges((wall,), ())
+
+    def notifyWallChanges(self, removed, added):
+        """
+        Updates the field once after several walls are added or removed. The
+        maze already shows all of the changes. The distances that depended on
+        the closed passages are raised first, without the opened passages, and
+        then the distances that can use the opened passages are lowered.
+
+        Args:
+            removed (iterable): The walls that were removed.
+            added (iterable): The walls that were added.
+        """
+        findIndexOfVertex = self.maze.findIndexOfVertex
+        opened = [(findIndexOfVertex(wall[0]), findIndexOfVertex(wall[1])) for wall in removed]
+        opened = [(indexOf_a, indexOf_b) for indexOf_a, indexOf_b in opened if indexOf_a >= 0 and indexOf_b >= 0]
+        closed = [(findIndexOfVertex(wall[0]), findIndexOfVertex(wall[1])) for wall in added]
+        closed = [(indexOf_a, indexOf_b) for indexOf_a, indexOf_b in closed if indexOf_a >= 0 and indexOf_b >= 0]
+        if closed and self.__passagesClosed(closed, opened):
+            return
+        if opened:
+            self.__passagesOpened(opened)
+
+    def __passagesOpened(self, passages):
+        """
+        Lowers the distances that can use newly opened passages.
+
+        Args:
+            passages (list): The (a, b) index pairs of the ends of the opened passages.
+        """
+        d = self.__flat
+        unreachable = DistanceField.UNREACHABLE
+        queue = deque()
+        for indexOf_a, indexOf_b in passages:
+            da, db = d[indexOf_a], d[indexOf_b]
+            # Start from the end that gets closer to the goal.
+            if da != unreachable and (db == unreachable or da + 1 < db):
+                d[indexOf_b] = da + 1
+                queue.append(indexOf_b)
+            elif db != unreachable and (da == unreachable or db + 1 < da):
+                d[indexOf_a] = db + 1
+                queue.append(indexOf_a)
+
+        getNeighborIndices = self.maze.getNeighborIndices
+        while queue:
+            indexOf_v = queue.popleft()
+            nd = d[indexOf_v] + 1
+            for indexOf_u in getNeighborIndices(indexOf_v):
+                du = d[indexOf_u]
+                if du == unreachable or nd < du:
+                    d[indexOf_u] = nd
+                    queue.append(indexOf_u)
+
+    def __passagesClosed(self, passages, opened):
+        """
+        Raises the distances that depended on closed passages, as if the
+        opened passages were still closed. If more than RECOMPUTE_FRACTION of
+        the vertices lost every shortest path, the field is computed from
+        scratch instead, which covers the opened passages as well.
+
+        Args:
+            passages (list): The (a, b) index pairs of the ends of the closed passages.
+            opened (list): The (a, b) index pairs of the ends of the passages opened in the same update.
+
+        Returns:
+            bool: True if the field was computed from scratch, False otherwise.
+        """
+        d = self.__flat
+        unreachable = DistanceField.UNREACHABLE
+
+        # The neighbors of every visited vertex are read from the walls only once.
+        getNeighborIndices = self.maze.getNeighborIndices
+        excluded = {}
+        for indexOf_a, indexOf_b in opened:
+            excluded.setdefault(indexOf_a, set()).add(indexOf_b)
+            excluded.setdefault(indexOf_b, set()).add(indexOf_a)
+        neighborsOf = {}
+        def getNeighbors(indexOf_v):
+            neighbors = neighborsOf.get(indexOf_v)
+            if neighbors is None:
+                neighbors = getNeighborIndices(indexOf_v)
+                if indexOf_v in excluded:
+                    neighbors = [u for u in neighbors if u not in excluded[indexOf_v]]
+                neighborsOf[indexOf_v] = neighbors
+            return neighbors
+
+        # The farther end of every closed passage that was a step of a shortest path.
+        candidates = []
+        for indexOf_a, indexOf_b in passages:
+            da, db = d[indexOf_a], d[indexOf_b]
+            if da != unreachable and db != unreachable and abs(da - db) == 1:
+                farther = indexOf_a if da > db else indexOf_b
+                candidates.append((d[farther], farther))
+        if not candidates:
+            return False
+
+        # Collect the vertices that lost every shortest path in order of their
+        # distance, so the affected vertices one step closer to the goal are
+        # known before a vertex is checked. A vertex keeps its distance if a
+        # neighbor outside the affected set is one step closer to the goal.
+        limit = DistanceField.RECOMPUTE_FRACTION * len(d)
+        heapq.heapify(candidates)
+        affected = set()
+        while candidates:
+            dv, indexOf_v = heapq.heappop(candidates)
+            if indexOf_v in affected:
+                continue
+            isSupported = False
+            for indexOf_u in getNeighbors(indexOf_v):
+                if d[indexOf_u] == dv - 1 and indexOf_u not in affected:
+                    isSupported = True
+                    break
+            if isSupported:
+                continue
+            affected.add(indexOf_v)
+            if len(affected) > limit:
+                self.compute()
+                return True
+            for indexOf_u in getNeighbors(indexOf_v):
+                if d[indexOf_u] == dv + 1 and indexOf_u not in affected:
+                    heapq.heappush(candidates, (dv + 1, indexOf_u))
+
+        # Seed the affected vertices from their unaffected neighbors and settle them in order.
+        heap = []
+        for indexOf_v in affected:
+            d[indexOf_v] = unreachable
+        for indexOf_v in affected:
+            best = min((d[u] for u in getNeighbors(indexOf_v) if u not in affected and d[u] != unreachable),
+                       default=None)
+            if best is not None:
+                heap.append((best + 1, indexOf_v))
+        heapq.heapify(heap)
+        while heap:
+            distance, indexOf_v = heapq.heappop(heap)
+            dv = d[indexOf_v]
+            if dv != unreachable and dv <= distance:
+                continue
+            d[indexOf_v] = distance
+            for indexOf_u in getNeighbors(indexOf_v):
+                du = d[indexOf_u]
+                if indexOf_u in affected and (du == unreachable or du > distance + 1):
+                    heapq.heappush(heap, (distance + 1, indexOf_u))
+        return False
+
+    def getPath(self, start):
+        """
+        Returns the shortest path from a vertex to the goal by greedy descent.
+
+        Args:
+            start (tuple): The coordinates of the vertex.
+
+        Returns:
+            list: The path as a list of indices, or None if the goal is not reachable.
+        """
+        d = self.__flat
+        index = self.maze.findIndexOfVertex(start)
+        if d[index] == DistanceField.UNREACHABLE:
+            return None
+
+        path = [index]
+        while d[index] > 0:
+            target = d[index] - 1
+            index = next(u for u in self.maze.getNeighborIndices(index) if d[u] == target)
+            path.append(index)
+        return path
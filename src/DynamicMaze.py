@@ -1,8 +1,14 @@
 from MazeGenerator import MazeGenerator
 from Pawn import Pawn
 from Maze import Maze
-from RandomNumberGenerator import RandomNumberGenerator
-import matplotlib.pyplot as plt
+from MazeView import MazeView
+from DistanceField import DistanceField
+from BridgeIndex import BridgeIndex
+from SeedTree import SeedTree
+from ChangeSet import ChangeSet
+from Stats import Stats
+import numpy as np
+import time
 
 class DynamicMaze(Maze):
     """
@@ -11,39 +17,155 @@ class DynamicMaze(Maze):
     Inherits from the Maze class.
 
     Attributes:
-        walls (list): A list of walls in the maze.
-        vertices (list): A list of vertices in the maze.
-        pawn (Pawn): The pawn object in the maze.
-        randomNumberGenerator (RandomNumberGenerator): The random number generator object.
+        walls (WallGrid): The walls in the maze.
+        vertices (GridVertices): The vertices in the maze.
+        view (MazeView): The read-only view of the maze that all pawns search in.
+        pawns (list): The pawns in the maze.
+        pawn (Pawn): The first pawn in the maze.
+        generationTime (float): The time the generation of the initial maze took in seconds.
+        bridgeIndex (BridgeIndex): The passages whose closing would disconnect the maze, or None in the 'batched'
+            mode, which checks the connectivity of all changes of a tick at once.
+        planner (str): The path planner of the pawns.
+        distanceFields (dict): The distance field of every goal, shared by the pawns with that goal, if they use the 'field' planner.
+        distanceField (DistanceField): The distance field to the goal of the first pawn, if the pawns use the 'field' planner.
+        replansPerformed (int): The number of times the path of a pawn was recalculated after a wall change.
+        replansSkipped (int): The number of times a wall change provably could not change the path of a pawn.
+        seed (int): The root seed that defines the maze and all of its updates.
+        updateMode (str): 'sequential' to apply and replan after every wall change, or 'batched' to apply all
+            wall changes of a tick at once and replan once per tick.
+        randomNumberGenerator (RandomNumberGenerator): The random number generator of the updates.
+        changeSet (ChangeSet): The changes of the current tick, which starts with every call of updateMaze.
 
     Methods:
-        __init__(rows, cols): Initializes the DynamicMaze object.
+        __init__(rows, cols, planner, generator, seed, updateMode, historyCapacity, pawns): Initializes the DynamicMaze object.
+        drawBudget(rows, cols, generator, pawns, updateFactor, ticks): Returns the number of random numbers a run draws at most.
+        addPawn(startPosition, goal): Adds a pawn to the maze.
         __removeWall(wall): Removes a wall from the maze.
         __addWall(wall): Adds a wall to the maze.
-        __createsChain(wall): Checks if adding a wall would create a chain in the maze.
-        updateMaze(updateFactor): Updates the maze by adding or removing walls.
-        plot(): Plots the maze and the pawn.
+        __toggleWall(wall): Removes a wall if it exists, otherwise adds it.
+        __applyWalls(walls): Applies all wall changes of a tick at once and returns them.
+        __findDisconnectingWalls(added): Finds the added walls that have to stay open to keep the maze connected.
+        __replan(pawns): Recalculates the paths of the given pawns on the shared maze view and graph.
+        updateMaze(updateFactor): Starts a new tick and updates the maze by adding or removing walls.
+        movePawn(): Moves every pawn one step and records the moves in the change set.
+        plot(): Plots the maze and the pawns.
     """
 
-    def __init__(self, rows=12, cols=12):
+    UPDATE_MODES = ('sequential', 'batched')
+
+    def __init__(self, rows=12, cols=12, planner='astar', generator='prim', seed=None, updateMode='sequential',
+                 historyCapacity=None, pawns=1):
         """
         Initialize the DynamicMaze object.
 
         Parameters:
         - rows: The number of rows in the maze. Default is 12.
         - cols: The number of columns in the maze. Default is 12.
+        - planner: The path planner of the pawns, 'astar', 'incremental' or 'field'. Default is 'astar'.
+        - generator: The name of the maze generation algorithm in MazeGenerator.ALGORITHMS. Default is 'prim'.
+        - seed: The root seed of the run, or a SeedTree node to draw the streams from.
+          The maze generation and the placement of the pawns use streams of
+          the length of their draw budgets at the start of it, and the updates
+          use the rest. If None, a random seed is chosen and stored in seed.
+        - updateMode: 'sequential' to apply the wall changes one by one and
+          recalculate the paths after every change that can affect them, or
+          'batched' to apply all changes of a tick at once, check them with one
+          connectivity labeling, update the distance fields once and recalculate
+          the paths once. Default is 'sequential'.
+        - historyCapacity: The maximum number of positions kept in the move history
+          of a pawn. Default is None, which keeps all of them.
+        - pawns: The number of pawns. The first pawn goes from (0, 0) to
+          (rows - 1, cols - 1), the others get random starts and goals. Default is 1.
 
         Returns:
         None
         """
+        assert updateMode in DynamicMaze.UPDATE_MODES, f"The update mode should be one of {DynamicMaze.UPDATE_MODES}."
         super().__init__(rows, cols)
-        mazeGenerator = MazeGenerator(rows, cols)
+        seedTree = seed if isinstance(seed, SeedTree) else SeedTree(seed)
+        self.seed = seedTree.seed
+        generationLength = MazeGenerator.drawBudget(rows, cols, generator)
+        placementLength = 2 * max(0, pawns - 1)
+        assert seedTree.length >= generationLength + placementLength, \
+            f"The stream of the run should hold at least {generationLength + placementLength} values."
+        generationStream = seedTree.part(0, generationLength)
+        placementStream = seedTree.part(generationLength, placementLength)
+        updateStream = seedTree.part(generationLength + placementLength,
+                                     seedTree.length - generationLength - placementLength)
+        mazeGenerator = MazeGenerator(rows, cols, generator, generationStream.generator())
         mazeGenerator.generateMaze()
+        self.generationTime = mazeGenerator.generationTime
         self.walls = mazeGenerator.maze.walls
         self.vertices = mazeGenerator.maze.vertices
-        self.pawn = Pawn((0, 0), (rows - 1, cols - 1), self.copy())
-        self.pawn.setPath(self.pawn.findPath())
-        self.randomNumberGenerator = RandomNumberGenerator()
+        self.bridgeIndex = BridgeIndex(self) if updateMode == 'sequential' else None
+        self.view = MazeView(self)
+        self.planner = planner
+        self.historyCapacity = historyCapacity
+        self.distanceFields = {}
+        self.pawns = []
+        self.addPawn((0, 0), (rows - 1, cols - 1))
+        self.distanceField = self.distanceFields.get(self.pawn.goal)
+        # Random starts and goals of the other pawns.
+        placements = placementStream.generator().generateBlock(2 * max(0, pawns - 1)) % (rows * cols)
+        for start, goal in placements.reshape(-1, 2).tolist():
+            self.addPawn(self.vertices[start], self.vertices[goal])
+        self.randomNumberGenerator = updateStream.generator()
+        self.replansPerformed = 0
+        self.replansSkipped = 0
+        self.updateMode = updateMode
+        self.changeSet = ChangeSet()
+        self.__plotAxes = None
+        self.__plottedTick = None
+        self.__plottedPawns = 0
+
+    @property
+    def pawn(self):
+        """
+        The first pawn in the maze.
+        """
+        return self.pawns[0]
+
+    @staticmethod
+    def drawBudget(rows, cols, generator='prim', pawns=1, updateFactor=0, ticks=0):
+        """
+        Returns the number of random numbers a run draws at most: the
+        generation of the maze, the placement of the pawns and three numbers
+        per candidate wall of every tick.
+
+        Parameters:
+        - rows: The number of rows in the maze.
+        - cols: The number of columns in the maze.
+        - generator: The name of the maze generation algorithm. Default is 'prim'.
+        - pawns: The number of pawns. Default is 1.
+        - updateFactor: The number of candidate walls per tick. Default is 0.
+        - ticks: The number of ticks. Default is 0.
+
+        Returns:
+        The number of random numbers.
+        """
+        return MazeGenerator.drawBudget(rows, cols, generator) + 2 * max(0, pawns - 1) + 3 * updateFactor * ticks
+
+    def addPawn(self, startPosition, goal):
+        """
+        Add a pawn to the maze and find its path. Pawns with the 'field'
+        planner share one distance field per goal.
+
+        Parameters:
+        - startPosition: The starting position of the pawn.
+        - goal: The goal position of the pawn.
+
+        Returns:
+        The new pawn.
+        """
+        distanceField = None
+        if self.planner == 'field':
+            if goal not in self.distanceFields:
+                self.distanceFields[goal] = DistanceField(self, goal)
+            distanceField = self.distanceFields[goal]
+        pawn = Pawn(startPosition, goal, self.view, self.planner, distanceField, self.historyCapacity)
+        pawn.setPath(pawn.findPath())
+        self.pawns.append(pawn)
+        return pawn
 
     def __removeWall(self, wall):
         """
@@ -57,6 +179,7 @@ class DynamicMaze(Maze):
         """
         if self.hasWall(wall):
             self.walls.remove(wall)
+            self.__notifyWallChange(wall)
 
     def __addWall(self, wall):
         """
@@ -70,45 +193,271 @@ class DynamicMaze(Maze):
         """
         if not self.hasWall(wall):
             self.walls.append(wall)
+            self.__notifyWallChange(wall)
 
-    def __createsChain(self, wall):
+    def __notifyWallChange(self, wall):
         """
-        Check if adding a wall would create a chain in the maze.
-        A chain is created when a vertex becomes isolated from the rest of the maze.
+        Inform the bridge index, the distance fields and the pawns that a wall
+        was added or removed. If instrumentation is on, the maintenance of
+        each of them is timed as its own phase.
 
         Parameters:
-        - wall: The wall to be added.
+        - wall: The wall that changed.
+
+        Returns:
+        None
+        """
+        stats = Stats.active
+        self.changeSet.recordWall(wall)
+        if stats is not None:
+            startTime = time.perf_counter()
+        self.bridgeIndex.notifyWallChange(wall)
+        if stats is not None:
+            bridgeTime = time.perf_counter()
+            stats.addTime('bridgeIndex', bridgeTime - startTime)
+        for distanceField in self.distanceFields.values():
+            distanceField.notifyWallChange(wall)
+        if stats is not None:
+            fieldTime = time.perf_counter()
+            stats.addTime('distanceFields', fieldTime - bridgeTime)
+        for pawn in self.pawns:
+            pawn.notifyWallChange(wall)
+        if stats is not None:
+            stats.addTime('planners', time.perf_counter() - fieldTime)
+
+    def __sampleWalls(self, updateFactor):
+        """
+        Sample the candidate walls of a tick with one block of random numbers.
+
+        Parameters:
+        - updateFactor: The number of candidate walls.
+
+        Returns:
+        The candidate walls as a list of (start, end) tuples.
+        """
+        # Three random numbers per candidate: the row, the column and the direction of the wall.
+        randomNumbers = self.randomNumberGenerator.generateBlock(3 * updateFactor).reshape(updateFactor, 3)
+        rows = randomNumbers[:, 0] % (self.getRows() - 1)
+        cols = randomNumbers[:, 1] % (self.getCols() - 1)
+        # Direction of the end vertex (up, down, left, right).
+        directions = np.array([(0, 1), (0, -1), (1, 0), (-1, 0)])[randomNumbers[:, 2] % 4]
+        return [((row, col), (row + dx, col + dy))
+                for row, col, (dx, dy) in zip(rows.tolist(), cols.tolist(), directions.tolist())]
+
+    def __toggleWall(self, wall):
+        """
+        Remove a wall if it exists, otherwise add it. Walls outside the maze and
+        walls that would close a bridge are not added, since those would
+        disconnect the maze. The bridge index covers the whole maze, so this
+        one check keeps every pawn connected to its goal.
+
+        Parameters:
+        - wall: The wall to toggle.
+
+        Returns:
+        'removed' or 'added' for the change made, or None if the wall was rejected.
+        """
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        if self.hasWall(wall):
+            self.__removeWall(wall)
+            change = 'removed'
+        elif not self.isVertex(wall[1]):
+            change = None
+        else:
+            if stats is not None:
+                checkTime = time.perf_counter()
+            isBridge = self.bridgeIndex.isBridge(wall)
+            if stats is not None:
+                stats.addTime('bridgeIndex', time.perf_counter() - checkTime)
+            if isBridge:
+                change = None
+            else:
+                self.__addWall(wall)
+                change = 'added'
+        if stats is not None:
+            stats.count({'removed': 'wallsRemoved', 'added': 'wallsAdded', None: 'wallsRejected'}[change])
+            stats.addTime('toggleWall', time.perf_counter() - startTime)
+        return change
+
+    def __applyWalls(self, walls):
+        """
+        Apply all wall changes of a tick at once. Every distinct candidate is
+        toggled once against the walls at the start of the tick: the existing
+        walls are removed and the others are added, except for walls outside
+        the maze. The additions are checked together with one connectivity
+        labeling, and those that would disconnect the maze stay open. Then the
+        distance fields and the pawns are informed of all changes at once.
+
+        Parameters:
+        - walls: The candidate walls.
+
+        Returns:
+        The removed walls and the added walls as two lists.
+        """
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        removed, added = [], []
+        candidates = set()
+        for wall in walls:
+            # A wall and its reverse are the same wall.
+            candidate = (min(wall), max(wall))
+            if candidate in candidates or not self.isVertex(wall[1]):
+                continue
+            candidates.add(candidate)
+            (removed if self.hasWall(wall) else added).append(wall)
+        for wall in removed:
+            self.walls.remove(wall)
+        for wall in added:
+            self.walls.append(wall)
+        if added:
+            if stats is not None:
+                checkTime = time.perf_counter()
+            disconnecting = self.__findDisconnectingWalls(added)
+            for wall in disconnecting:
+                self.walls.remove(wall)
+            added = [wall for wall in added if wall not in disconnecting]
+            if stats is not None:
+                stats.addTime('connectivity', time.perf_counter() - checkTime)
+        for wall in removed + added:
+            self.changeSet.recordWall(wall)
+
+        if stats is not None:
+            stats.count('wallsRemoved', len(removed))
+            stats.count('wallsAdded', len(added))
+            stats.count('wallsRejected', len(walls) - len(removed) - len(added))
+            fieldStartTime = time.perf_counter()
+        for distanceField in self.distanceFields.values():
+            distanceField.notifyWallChanges(removed, added)
+        if stats is not None:
+            fieldTime = time.perf_counter()
+            stats.addTime('distanceFields', fieldTime - fieldStartTime)
+        for pawn in self.pawns:
+            pawn.notifyWallChanges(removed, added)
+        if stats is not None:
+            stats.addTime('planners', time.perf_counter() - fieldTime)
+            stats.addTime('toggleWall', time.perf_counter() - startTime)
+        return removed, added
+
+    def __findDisconnectingWalls(self, added):
+        """
+        Find the added walls that have to stay open to keep the maze connected,
+        with one labeling of the connected parts of the maze with all of them
+        in place. The maze was connected before the additions, so the added
+        walls join all parts, and every added wall that joins two parts not
+        yet joined by an earlier one has to stay open.
+
+        Parameters:
+        - added: The added walls, which the maze already shows.
 
         Returns:
-        - True if adding the wall would create a chain, False otherwise.
+        The set of the walls that have to stay open.
         """
-        # Unpack the wall coordinates
-        (start, end) = wall
+        offsets, neighbors = self.converToGraph().getAdjacencyLists()
+        labels = [-1] * (len(offsets) - 1)
+        parts = 0
+        for root in range(len(labels)):
+            if labels[root] >= 0:
+                continue
+            labels[root] = parts
+            stack = [root]
+            while stack:
+                indexOf_v = stack.pop()
+                for indexOf_u in neighbors[offsets[indexOf_v]:offsets[indexOf_v + 1]]:
+                    if labels[indexOf_u] < 0:
+                        labels[indexOf_u] = parts
+                        stack.append(indexOf_u)
+            parts += 1
+        if parts == 1:
+            return set()
 
-        # Get the neighbors of the start and end vertices
-        startNeighbors = self.getNeighborVertices(start)
-        endNeighbors = self.getNeighborVertices(end)
+        # Join the parts with a union-find, in the order of the walls.
+        parents = list(range(parts))
+        def findRoot(part):
+            while parents[part] != part:
+                parents[part] = parents[parents[part]]
+                part = parents[part]
+            return part
 
-        # Check if adding this wall would isolate either the start or end vertex.
-        # If a vertex has only one neighbor adding this wall would be isolating it.
-        if len(startNeighbors) == 1 or len(endNeighbors) == 1:
-            return True
+        disconnecting = set()
+        for wall in added:
+            a = findRoot(labels[self.findIndexOfVertex(wall[0])])
+            b = findRoot(labels[self.findIndexOfVertex(wall[1])])
+            if a != b:
+                parents[a] = b
+                disconnecting.add(wall)
+        return disconnecting
 
-        # Check if adding this wall would create a chain for the start vertex.
-        startChain = all(self.hasWall((start, neigh)) for neigh in startNeighbors)
-        if startChain:
-            return True
+    def __affectsPath(self, pawn, wall, change):
+        """
+        Check if a wall change can change the path of a pawn. An added wall
+        off the path leaves the path valid and shortest, and a removed wall
+        that cannot shorten the path leaves it shortest.
 
-        # Check if adding this wall would create a chain for the end vertex.
-        endChain = all(self.hasWall((end, neigh)) for neigh in endNeighbors)
-        if endChain:
-            return True
+        Parameters:
+        - pawn: The pawn.
+        - wall: The changed wall.
+        - change: 'removed' or 'added'.
 
-        return False
+        Returns:
+        True if the path has to be recalculated, False otherwise.
+        """
+        if change == 'removed':
+            return pawn.canShortcut(wall)
+        return pawn.isOnPath(wall)
+
+    def __replan(self, pawns):
+        """
+        Recalculate the paths of the given pawns. The pawns search in the
+        shared view of the maze, which always shows the current walls, so
+        nothing is copied, and the A* pawns share the graph of the maze, which
+        is built at most once per version of the walls.
+
+        Parameters:
+        - pawns: The indices of the pawns.
+
+        Returns:
+        None
+        """
+        if not pawns:
+            return
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        graph = self.view.converToGraph() if self.planner == 'astar' else None
+        for i in sorted(pawns):
+            pawn = self.pawns[i]
+            self.replansPerformed += 1
+            oldPath = pawn.getPath()
+            if stats is not None:
+                findStartTime = time.perf_counter()
+                pawn.setPath(pawn.findPath(graph))
+                stats.addTime('findPath', time.perf_counter() - findStartTime)
+            else:
+                pawn.setPath(pawn.findPath(graph))
+            self.changeSet.recordPathChange(oldPath, pawn.getPath(), i)
+        if stats is not None:
+            stats.count('replans', len(pawns))
+            stats.addTime('replan', time.perf_counter() - startTime)
 
     def updateMaze(self, updateFactor):
         """
-        Update the maze by adding or removing walls.
+        Start a new tick and update the maze by adding or removing walls.
+
+        In the 'sequential' mode the candidates are toggled one by one, every
+        addition is checked against the bridge index, and the paths of the
+        pawns are recalculated after every wall change that can affect them.
+        In the 'batched' mode all changes of the tick are applied at once, the
+        additions are checked together with one connectivity labeling, the
+        distance fields and the planners are updated once, and the affected
+        paths are recalculated together at the end. Both modes draw the same
+        candidates, but a candidate drawn twice is toggled only once in the
+        'batched' mode and the additions that would disconnect the maze are
+        chosen differently, so the walls of the two modes differ while their
+        changes follow the same distribution. If instrumentation is on, the
+        phases of the update are timed and counted in Stats.active.
 
         Parameters:
         - updateFactor: The number of walls to add or remove.
@@ -116,55 +465,102 @@ class DynamicMaze(Maze):
         Returns:
         None
         """
-        # Update the maze by adding or removing walls
-        for _ in range(updateFactor):
-            # Select random row and column to add or remove walls
-            row = (self.randomNumberGenerator.generate() % (self.getRows() - 1))
-            col = (self.randomNumberGenerator.generate() % (self.getCols() - 1))
-
-            start = (row, col)
-            # Randomly select the direction of the end vertex (up, down, left, right)
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            direction = directions[self.randomNumberGenerator.generate() % 4]
-
-            end = (start[0] + direction[0], start[1] + direction[1])
-            wall = (start, end)
-            # If the random wall already exists, remove it. Otherwise, add it.
-            if self.hasWall(wall):
-                self.__removeWall(wall)
-
-                # Update the path of the pawn.
-                self.pawn.setMaze(self.copy())
-                calculatedPath = self.pawn.findPath()
-                self.pawn.setPath(calculatedPath)
-            else:
-                # Check if adding this wall would create a chain in the maze.
-                # If it does, skip this wall.
-                if self.__createsChain(wall):
+        self.changeSet = ChangeSet(self.changeSet.tick + 1)
+        if updateFactor <= 0:
+            return
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+            replansSkipped = self.replansSkipped
+        walls = self.__sampleWalls(updateFactor)
+        if stats is not None:
+            stats.addTime('sampleWalls', time.perf_counter() - startTime)
+
+        if self.updateMode == 'sequential':
+            for wall in walls:
+                change = self.__toggleWall(wall)
+                if change is None:
                     continue
-                self.__addWall(wall)
+                affected = [i for i, pawn in enumerate(self.pawns) if self.__affectsPath(pawn, wall, change)]
+                self.replansSkipped += len(self.pawns) - len(affected)
+                self.__replan(affected)
+        else:
+            removed, added = self.__applyWalls(walls)
+            # Once a change affects the path of a pawn, its remaining changes are covered by the single replan.
+            affected = set()
+            changes = [(wall, 'removed') for wall in removed] + [(wall, 'added') for wall in added]
+            for wall, change in changes:
+                for i, pawn in enumerate(self.pawns):
+                    if i in affected:
+                        continue
+                    if self.__affectsPath(pawn, wall, change):
+                        affected.add(i)
+                    else:
+                        self.replansSkipped += 1
+            self.__replan(affected)
 
-                # Check if the pawn can still find a path after adding the wall.
-                # If not, remove the wall.
-                self.pawn.setMaze(self.copy())
-                calculatedPath = self.pawn.findPath()
-                if calculatedPath is None:
-                    self.__removeWall(wall)
-                    self.pawn.setMaze(self.copy())
-                else:
-                    # Update the path of the pawn.
-                    self.pawn.setPath(calculatedPath)
+        if stats is not None:
+            stats.count('replansSkipped', self.replansSkipped - replansSkipped)
+            stats.addTime('updateMaze', time.perf_counter() - startTime)
+
+    def movePawn(self):
+        """
+        Move every pawn one step along its path and record the moves in the
+        change set, together with the positions their move histories dropped.
+        The pawns should be moved through this method, so that renderers see
+        the moves.
+
+        Returns:
+        None
+        """
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        for i, pawn in enumerate(self.pawns):
+            oldPosition = pawn.position
+            oldFirstPosition = pawn.move_history[0]
+            pawn.move()
+            if pawn.position != oldPosition:
+                self.changeSet.recordPawnMove(self.findIndexOfVertex(oldPosition), self.findIndexOfVertex(pawn.position), i)
+            if pawn.move_history[0] != oldFirstPosition:
+                self.changeSet.recordHistoryDrop(self.findIndexOfVertex(oldFirstPosition),
+                                                 self.findIndexOfVertex(pawn.move_history[0]), i)
+        if stats is not None:
+            stats.addTime('movePawn', time.perf_counter() - startTime)
 
     def plot(self):
         """
-        Plot the maze and the pawn.
+        Plot the maze and the pawns. The artists of the maze and the pawns are
+        kept between calls and only updated, so the figure is never cleared.
+        If the last plotted tick is the one before the current tick, only the
+        walls in the change set are recolored, and a pawn is updated only if
+        it moved or its path changed.
 
         Returns:
         None
         """
-        plt.clf()
-        super().plot()
-        self.pawn.plot()
-        plt.axis('square')
+        import matplotlib.pyplot as plt
+
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        axes = plt.gca()
+        changeSet = self.changeSet
+        if (axes is self.__plotAxes and changeSet.tick == self.__plottedTick + 1 and
+                len(self.pawns) == self.__plottedPawns):
+            super().plot(changedWalls=changeSet.walls)
+            for i, pawn in enumerate(self.pawns):
+                if changeSet.pawnChanged(i):
+                    pawn.plot()
+        else:
+            super().plot()
+            for pawn in self.pawns:
+                pawn.plot()
+            plt.axis('square')
+        self.__plotAxes = axes
+        self.__plottedTick = changeSet.tick
+        self.__plottedPawns = len(self.pawns)
         plt.draw()
         plt.pause(0.001)
+        if stats is not None:
+            stats.addTime('plot', time.perf_counter() - startTime)
@@ -0,0 +1,130 @@
+from RandomNumberGenerator import RandomNumberGenerator
+from Maze import Maze
+import numpy as np
+
+class EllerMazeGenerator:
+    """
+    This class represents a streaming maze generator based on Eller's algorithm.
+
+    The maze is produced one line of constant x at a time. Only the set
+    membership of the cells on the current line is kept, so the memory used
+    is proportional to a single line no matter how many lines there are. A
+    line determines the north walls between its own cells and the east walls
+    towards the next line.
+
+    Attributes:
+        rows (int): The number of rows in the maze.
+        cols (int): The number of columns in the maze.
+        __randomNumberGenerator (RandomNumberGenerator): The random number generator object.
+
+    Methods:
+        __init__(self, rows, cols, randomNumberGenerator=None): Initializes an EllerMazeGenerator object.
+        __randomBlock(self, n): Returns the next n random numbers as an array.
+        generateRows(self): Generates the walls of the maze line by line.
+        generateToFile(self, path, flushEvery=1024): Writes the maze into a memory-mapped .npy file.
+    """
+
+    def __init__(self, rows=12, cols=12, randomNumberGenerator=None):
+        """
+        Initializes an EllerMazeGenerator object.
+
+        Args:
+            rows (int): The number of rows in the maze. Default is 12.
+            cols (int): The number of columns in the maze. Default is 12.
+            randomNumberGenerator (RandomNumberGenerator): The random number generator to draw from.
+                Default is None, which creates a new one.
+        """
+        self.rows = rows
+        self.cols = cols
+        if randomNumberGenerator is None:
+            randomNumberGenerator = RandomNumberGenerator()
+        self.__randomNumberGenerator = randomNumberGenerator
+
+    def __randomBlock(self, n):
+        """
+        Returns the next n random numbers as an array.
+
+        Args:
+            n (int): The number of random numbers.
+
+        Returns:
+            numpy.ndarray: The random numbers.
+        """
+        return self.__randomNumberGenerator.generateBlock(n)
+
+    def generateRows(self):
+        """
+        Generates the walls of the maze line by line.
+
+        Yields:
+            tuple: The line x and two boolean arrays of length cols with the north
+            and the east walls of the cells (x, 0) to (x, cols - 1).
+        """
+        rows, cols = self.rows, self.cols
+        # Set of every cell on the current line, and the next unused set id.
+        sets = np.arange(cols, dtype=np.int64)
+        nextSet = cols
+
+        for x in range(rows):
+            lastLine = x == rows - 1
+            north = np.zeros(cols, dtype=bool)
+            north[:cols - 1] = True
+            east = np.zeros(cols, dtype=bool)
+
+            # Join neighbouring cells of different sets at random, or always on the last line.
+            parent = {}
+            def find(s):
+                while parent.get(s, s) != s:
+                    s = parent[s]
+                return s
+            joins = self.__randomBlock(cols - 1).tolist() if not lastLine else [0] * (cols - 1)
+            for y in range(cols - 1):
+                a, b = find(int(sets[y])), find(int(sets[y + 1]))
+                if a != b and joins[y] % 2 == 0:
+                    parent[b] = a
+                    north[y] = False
+            sets = np.array([find(int(s)) for s in sets], dtype=np.int64)
+
+            if lastLine:
+                yield x, north, east
+                break
+
+            # Every set continues to the next line through at least one cell.
+            down = self.__randomBlock(cols) % 2 == 0
+            order = np.argsort(sets, kind='stable')
+            groupStarts = np.flatnonzero(np.diff(sets[order], prepend=-1))
+            groupLengths = np.diff(groupStarts, append=cols)
+            missing = ~np.logical_or.reduceat(down[order], groupStarts)
+            if missing.any():
+                picks = self.__randomBlock(int(missing.sum())) % groupLengths[missing]
+                down[order[groupStarts[missing] + picks]] = True
+            east[:] = ~down
+
+            yield x, north, east
+
+            # Cells that did not continue start new sets on the next line.
+            newCells = ~down
+            sets[newCells] = np.arange(nextSet, nextSet + int(newCells.sum()))
+            nextSet += int(newCells.sum())
+
+    def generateToFile(self, path, flushEvery=1024):
+        """
+        Writes the maze into a memory-mapped .npy file of shape (2, rows, cols),
+        with the north walls first and the east walls second, and opens it.
+
+        Args:
+            path (str): The path of the file.
+            flushEvery (int): The number of lines after which written lines are flushed to disk. Default is 1024.
+
+        Returns:
+            Maze: The maze backed by the file, opened with Maze.fromFile.
+        """
+        grids = np.lib.format.open_memmap(path, mode='w+', dtype=bool, shape=(2, self.rows, self.cols))
+        for x, north, east in self.generateRows():
+            grids[0, x] = north
+            grids[1, x] = east
+            if (x + 1) % flushEvery == 0:
+                grids.flush()
+        grids.flush()
+        del grids
+        return Maze.fromFile(path)
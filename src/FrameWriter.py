@@ -0,0 +1,131 @@
+import os
+import queue
+import struct
+import threading
+import zlib
+import numpy as np
+
+class FrameWriter:
+    """
+    This class encodes RGB frames on a background thread.
+
+    Frames are copied into a queue and encoded by a worker thread, so the
+    simulation only pays for the copy. zlib releases the GIL while it
+    compresses, which lets encoding overlap with the next simulation steps.
+    Frames are written either as a sequence of PNG files, encoded with the
+    standard library, or appended to a single raw rgb24 video file that can
+    be converted with, for example,
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s WIDTHxHEIGHT -i video.rgb video.mp4.
+
+    Attributes:
+        path (str): The directory of the PNG files, or the path of the raw video file.
+        format (str): 'png' or 'raw'.
+        framesWritten (int): The number of frames encoded so far.
+
+    Methods:
+        __init__(self, path, format='png', queueSize=64, compressLevel=1): Initializes a FrameWriter object.
+        write(self, frame): Queues a frame for encoding.
+        close(self): Encodes the queued frames and stops the worker thread.
+    """
+
+    FORMATS = ('png', 'raw')
+
+    def __init__(self, path, format='png', queueSize=64, compressLevel=1):
+        """
+        Initializes a FrameWriter object and starts its worker thread.
+
+        Args:
+            path (str): The directory of the PNG files, or the path of the raw video file.
+            format (str): 'png' for a sequence of PNG files or 'raw' for a raw rgb24 video. Default is 'png'.
+            queueSize (int): The number of frames that can wait for encoding. write blocks
+                when the queue is full. Default is 64.
+            compressLevel (int): The zlib compression level of the PNG files. Default is 1.
+        """
+        assert format in FrameWriter.FORMATS, f"The format should be one of {FrameWriter.FORMATS}."
+        self.path = path
+        self.format = format
+        self.framesWritten = 0
+        self.__compressLevel = compressLevel
+        self.__queue = queue.Queue(queueSize)
+        self.__error = None
+        if format == 'png':
+            os.makedirs(path, exist_ok=True)
+            self.__file = None
+        else:
+            self.__file = open(path, 'wb')
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def write(self, frame):
+        """
+        Queues a copy of a frame for encoding.
+
+        Args:
+            frame (numpy.ndarray): The uint8 RGB frame of shape (height, width, 3).
+        """
+        if self.__error is not None:
+            raise self.__error
+        self.__queue.put(np.array(frame, dtype=np.uint8, copy=True))
+
+    def close(self):
+        """
+        Encodes the queued frames and stops the worker thread.
+        """
+        if self.__thread.is_alive():
+            self.__queue.put(None)
+            self.__thread.join()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        if self.__error is not None:
+            raise self.__error
+
+    def __run(self):
+        """
+        Encodes the frames of the queue until the end marker arrives.
+        """
+        while True:
+            frame = self.__queue.get()
+            if frame is None:
+                return
+            if self.__error is not None:
+                continue
+            try:
+                if self.format == 'png':
+                    with open(os.path.join(self.path, f"frame_{self.framesWritten:06d}.png"), 'wb') as file:
+                        file.write(FrameWriter.encodePng(frame, self.__compressLevel))
+                else:
+                    self.__file.write(frame.tobytes())
+                self.framesWritten += 1
+            except Exception as error:
+                self.__error = error
+
+    @staticmethod
+    def encodePng(frame, compressLevel=1):
+        """
+        Encodes an RGB frame as a PNG file with the standard library.
+
+        Args:
+            frame (numpy.ndarray): The uint8 RGB frame of shape (height, width, 3).
+            compressLevel (int): The zlib compression level. Default is 1.
+
+        Returns:
+            bytes: The PNG file.
+        """
+        height, width, _ = frame.shape
+        # Every scanline starts with filter type 0 (none).
+        scanlines = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+        scanlines[:, 1:] = frame.reshape(height, width * 3)
+
+        def chunk(kind, data):
+            return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+        header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+        return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) +
+                chunk(b'IDAT', zlib.compress(scanlines.tobytes(), compressLevel)) + chunk(b'IEND', b''))
@@ -1,30 +1,83 @@
+from GridVertices import GridVertices
 import numpy as np
 
 class Graph:
     """
     A class representing a graph.
 
+    The adjacency is stored in compressed sparse row (CSR) form: the
+    neighbors of the vertex with index i are neighbors[offsets[i]:offsets[i + 1]].
+    If the vertices are given as GridVertices, the graph works in grid-aware
+    index mode and converts between vertices and indices arithmetically.
+
     Attributes:
-        vertices (list): List of vertices in the graph.
-        edges (list): List of edges in the graph.
+        vertices (list or GridVertices): List of vertices in the graph.
+        edges (list): List of edges in the graph, materialized from the adjacency on first use.
+        offsets (numpy.ndarray): int32 array with the start of each vertex's neighbors.
+        neighbors (numpy.ndarray): int32 array with the neighbor indices of all vertices.
 
     Methods:
         hasVertex(v): Check if the given vertex is a vertex of the graph.
         findIndexOfVertex(v): Find the index of the given vertex in the graph.
+        getSuccessorIndices(index): Find the indices of the successors of the vertex with the given index.
         getSuccessors(v): Find the successors of the given vertex in the graph.
+        getAdjacencyLists(): Get the adjacency as Python lists for searches.
     """
 
-    def __init__(self, vertices : list, edges : list):
+    def __init__(self, vertices : list, edges : list = None, offsets=None, neighbors=None):
         """
         Initialize a Graph object.
 
+        Either the edges or the CSR adjacency must be given. Edges are treated
+        as undirected, the same as before the adjacency was introduced.
+
         Args:
-            vertices (list): List of vertices in the graph.
-            edges (list): List of edges in the graph.
+            vertices (list or GridVertices): List of vertices in the graph.
+            edges (list): List of edges in the graph as (index, index) pairs.
+            offsets (numpy.ndarray): int32 array with the start of each vertex's neighbors.
+            neighbors (numpy.ndarray): int32 array with the neighbor indices of all vertices.
         """
         self.vertices = vertices
-        self.edges = edges
-        
+        self.__edges = edges
+        if offsets is None or neighbors is None:
+            offsets, neighbors = self.__buildAdjacency(len(vertices), edges)
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.__adjacencyLists = None
+
+    @staticmethod
+    def __buildAdjacency(vertexCount, edges):
+        """
+        Build the CSR adjacency of an undirected edge list.
+
+        Args:
+            vertexCount (int): The number of vertices in the graph.
+            edges (list): List of edges in the graph as (index, index) pairs.
+
+        Returns:
+            tuple: The offsets and neighbors arrays.
+        """
+        pairs = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        # Add both directions and drop the duplicates.
+        pairs = np.unique(np.concatenate((pairs, pairs[:, ::-1])), axis=0)
+        offsets = np.zeros(vertexCount + 1, dtype=np.int32)
+        np.cumsum(np.bincount(pairs[:, 0], minlength=vertexCount), out=offsets[1:])
+        return offsets, np.ascontiguousarray(pairs[:, 1])
+
+    @property
+    def edges(self):
+        """
+        The edges of the graph. If the graph was built from an adjacency, the
+        edges are materialized once as (index, neighbor index) pairs.
+
+        Returns:
+            list: List of edges in the graph.
+        """
+        if self.__edges is None:
+            sources = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+            self.__edges = list(zip(sources.tolist(), self.neighbors.tolist()))
+        return self.__edges
+
     def hasVertex(self, v):
         """
         Check if the given vertex is a vertex of the graph.
@@ -35,7 +88,9 @@ class Graph:
         Returns:
             bool: True if the vertex is in the graph, False otherwise.
         """
-        return any([v == vertex for vertex in self.vertices])
+        if isinstance(self.vertices, GridVertices):
+            return v in self.vertices
+        return any(v == vertex for vertex in self.vertices)
  
     def findIndexOfVertex(self, v):
         """
@@ -47,11 +102,25 @@ class Graph:
         Returns:
             int: The index of the vertex in the graph, or -1 if not found.
         """
+        if isinstance(self.vertices, GridVertices):
+            return self.vertices.findIndex(v)
         for i, vertex in enumerate(self.vertices):
             if np.array_equal(vertex, v):
                 return i
         return -1
     
+    def getSuccessorIndices(self, index):
+        """
+        Find the indices of the successors of the vertex with the given index.
+
+        Args:
+            index (int): The index of the vertex.
+
+        Returns:
+            numpy.ndarray: A view of the neighbors array with the successor indices.
+        """
+        return self.neighbors[self.offsets[index]:self.offsets[index + 1]]
+
     def getSuccessors(self, v):
         """
         Find the successors of the given vertex in the graph.
@@ -62,14 +131,23 @@ class Graph:
         Returns:
             numpy.ndarray: An array of successors of the vertex.
         """
-        assert(self.hasVertex(v))
         index = self.findIndexOfVertex(v)
-        successors = []
-        for edge in self.edges:
-            # If first vertex of the edge is the given vertex, the second vertex is successor.
-            # And vice versa.
-            if edge[0] == index:
-                successors.append(self.vertices[edge[1]])
-            elif edge[1] == index:
-                successors.append(self.vertices[edge[0]])
-        return np.array(successors)
+        assert(index >= 0)
+        successorIndices = self.getSuccessorIndices(index)
+        if isinstance(self.vertices, GridVertices):
+            cols = self.vertices.getCols()
+            return np.stack((successorIndices // cols, successorIndices % cols), axis=1)
+        return np.array([self.vertices[i] for i in successorIndices])
+
+    def getAdjacencyLists(self):
+        """
+        Get the offsets and the neighbors as Python lists. Searches index them
+        element by element, which is faster on lists than on arrays. They are
+        converted once, so searches that share a graph share the lists.
+
+        Returns:
+            tuple: The offsets and neighbors lists.
+        """
+        if self.__adjacencyLists is None:
+            self.__adjacencyLists = (self.offsets.tolist(), self.neighbors.tolist())
+        return self.__adjacencyLists
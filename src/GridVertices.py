@@ -0,0 +1,146 @@
+class GridVertices:
+    """
+    A lazily materialized view of the vertices of a rectangular maze.
+
+    The vertex with index i is (i // cols, i % cols), so converting between
+    vertices and indices is plain arithmetic with a bounds check instead of a
+    scan over a list. The view behaves like the list of (x, y) tuples it
+    replaces: it can be indexed, sliced, iterated and checked with `in`.
+
+    Methods:
+        __init__(self, rows, cols): Initializes a new instance of the GridVertices class.
+        getRows(self): Returns the number of rows of the grid.
+        getCols(self): Returns the number of columns of the grid.
+        findIndex(self, v): Finds the index of a vertex, or -1 if it is not in the grid.
+        index(self, v): Finds the index of a vertex like list.index.
+        tolist(self): Materializes the vertices as a list of tuples.
+    """
+
+    def __init__(self, rows, cols):
+        """
+        Initializes a new instance of the GridVertices class.
+
+        Args:
+            rows (int): The number of rows in the maze.
+            cols (int): The number of columns in the maze.
+        """
+        self.__rows = rows
+        self.__cols = cols
+
+    def getRows(self):
+        """
+        Returns the number of rows of the grid.
+
+        Returns:
+            int: The number of rows of the grid.
+        """
+        return self.__rows
+
+    def getCols(self):
+        """
+        Returns the number of columns of the grid.
+
+        Returns:
+            int: The number of columns of the grid.
+        """
+        return self.__cols
+
+    def findIndex(self, v):
+        """
+        Finds the index of a vertex.
+
+        Args:
+            v (tuple): The coordinates of the vertex.
+
+        Returns:
+            int: The index of the vertex, or -1 if it is not in the grid.
+        """
+        try:
+            x, y = v
+        except (TypeError, ValueError):
+            return -1
+        if 0 <= x < self.__rows and 0 <= y < self.__cols:
+            return int(x) * self.__cols + int(y)
+        return -1
+
+    def index(self, v):
+        """
+        Finds the index of a vertex like list.index.
+
+        Args:
+            v (tuple): The coordinates of the vertex.
+
+        Returns:
+            int: The index of the vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the grid.
+        """
+        i = self.findIndex(v)
+        if i < 0:
+            raise ValueError(f"{v} is not a vertex of the maze.")
+        return i
+
+    def tolist(self):
+        """
+        Materializes the vertices as a list of tuples.
+
+        Returns:
+            list: The vertices in index order.
+        """
+        return list(self)
+
+    def __len__(self):
+        """
+        Returns the number of vertices.
+
+        Returns:
+            int: The number of vertices.
+        """
+        return self.__rows * self.__cols
+
+    def __getitem__(self, i):
+        """
+        Returns the vertex with the given index.
+
+        Args:
+            i (int or slice): The index of the vertex, or a slice of indices.
+
+        Returns:
+            tuple: The coordinates of the vertex, or a list of them for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("vertex index out of range")
+        i = int(i)
+        return (i // self.__cols, i % self.__cols)
+
+    def __iter__(self):
+        """
+        Iterates over the vertices in index order.
+
+        Yields:
+            tuple: The coordinates of the vertices.
+        """
+        for xind in range(self.__rows):
+            for yind in range(self.__cols):
+                yield (xind, yind)
+
+    def __contains__(self, v):
+        """
+        Checks if a vertex is in the grid.
+
+        Args:
+            v (tuple): The coordinates of the vertex.
+
+        Returns:
+            bool: True if the vertex is in the grid, False otherwise.
+        """
+        return self.findIndex(v) >= 0
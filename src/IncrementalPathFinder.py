@@ -0,0 +1,220 @@
+from array import array
+import heapq
+import math
+from Maze import Maze
+
+class IncrementalPathFinder:
+    """
+    Class representing an incremental path finder based on D* Lite.
+
+    The search runs backwards from the goal over the live walls of the maze and
+    keeps its state between calls. When a wall is added or removed, only the
+    two vertices of that wall are updated, and the next search repairs the part
+    of the search tree the change affects instead of starting over. The start
+    may move between searches, which is how the pawn uses it.
+
+    Attributes:
+        maze (Maze): The maze to search in.
+        start (tuple): The starting vertex.
+        goal (tuple): The goal vertex.
+
+    Methods:
+        __init__(self, maze, start, goal): Initializes an IncrementalPathFinder object.
+        setStart(self, start): Sets the starting vertex.
+        setMaze(self, maze): Sets the maze to search in.
+        reset(self): Discards the search state.
+        notifyWallChange(self, wall): Updates the search after a wall is added or removed.
+        computeShortestPath(self): Repairs the search tree until the start is consistent.
+        getPath(self): Returns the shortest path from the start vertex to the goal vertex.
+    """
+
+    def __init__(self, maze : Maze, start : tuple, goal : tuple):
+        """
+        Initializes an IncrementalPathFinder object.
+
+        Args:
+            maze (Maze): The maze to search in.
+            start (tuple): The starting vertex.
+            goal (tuple): The goal vertex.
+        """
+        self.maze = maze
+        self.start = start
+        self.goal = goal
+        self.reset()
+
+    def setStart(self, start):
+        """
+        Sets the starting vertex. The search state is kept.
+
+        Args:
+            start (tuple): The starting vertex.
+        """
+        self.start = start
+
+    def setMaze(self, maze : Maze):
+        """
+        Sets the maze to search in. The search state is kept only if the new
+        maze shares its walls with the current one.
+
+        Args:
+            maze (Maze): The maze to search in.
+        """
+        sameWalls = maze.walls is self.maze.walls
+        self.maze = maze
+        if not sameWalls:
+            self.reset()
+
+    def reset(self):
+        """
+        Discards the search state, so the next search starts from scratch.
+        """
+        vertexCount = self.maze.getRows() * self.maze.getCols()
+        # g   -> cost to the goal found by the last expansion.
+        self.__g = array('d', [math.inf]) * vertexCount
+        # rhs -> one step lookahead of g.
+        self.__rhs = array('d', [math.inf]) * vertexCount
+        # U   -> open list of (k1, k2, index) entries with lazy deletion.
+        self.__U = []
+        self.__openKeys = {}
+        # km  -> heuristic offset that accounts for the moves of the start.
+        self.__km = 0
+        self.__lastStart = self.start
+
+        indexOf_r = self.maze.findIndexOfVertex(self.goal)
+        self.__rhs[indexOf_r] = 0
+        self.__insert(indexOf_r, self.__calculateKey(indexOf_r))
+
+    def __heuristicMeasure(self, index):
+        """
+        Calculates the Manhattan distance between the start vertex and a vertex.
+
+        Args:
+            index (int): The index of the vertex.
+
+        Returns:
+            int: The heuristic measure.
+        """
+        x, y = divmod(index, self.maze.getCols())
+        return abs(x - self.start[0]) + abs(y - self.start[1])
+
+    def __calculateKey(self, index):
+        """
+        Calculates the priority of a vertex in the open list.
+
+        Args:
+            index (int): The index of the vertex.
+
+        Returns:
+            tuple: The key of the vertex.
+        """
+        k2 = min(self.__g[index], self.__rhs[index])
+        return (k2 + self.__heuristicMeasure(index) + self.__km, k2)
+
+    def __insert(self, index, key):
+        """
+        Inserts a vertex into the open list, or updates its key.
+
+        Args:
+            index (int): The index of the vertex.
+            key (tuple): The key of the vertex.
+        """
+        self.__openKeys[index] = key
+        heapq.heappush(self.__U, (key[0], key[1], index))
+
+    def __topKey(self):
+        """
+        Drops outdated entries from the top of the open list and returns its smallest key.
+
+        Returns:
+            tuple: The smallest key, or (inf, inf) if the open list is empty.
+        """
+        U = self.__U
+        while U:
+            k1, k2, index = U[0]
+            if self.__openKeys.get(index) == (k1, k2):
+                return (k1, k2)
+            heapq.heappop(U)
+        return (math.inf, math.inf)
+
+    def __updateVertex(self, index):
+        """
+        Recomputes the lookahead of a vertex and puts it in the open list if it is inconsistent.
+
+        Args:
+            index (int): The index of the vertex.
+        """
+        if index != self.maze.findIndexOfVertex(self.goal):
+            g = self.__g
+            self.__rhs[index] = min((g[s] + 1 for s in self.maze.getNeighborIndices(index)), default=math.inf)
+        self.__openKeys.pop(index, None)
+        if self.__g[index] != self.__rhs[index]:
+            self.__insert(index, self.__calculateKey(index))
+
+    def notifyWallChange(self, wall):
+        """
+        Updates the search after a wall is added or removed. The search tree
+        is repaired by the next call of computeShortestPath.
+
+        Args:
+            wall (tuple): The wall that changed.
+        """
+        for v in wall:
+            index = self.maze.findIndexOfVertex(v)
+            if index >= 0:
+                self.__updateVertex(index)
+
+    def computeShortestPath(self):
+        """
+        Repairs the search tree until the start vertex is consistent.
+
+        Returns:
+            float: The length of the shortest path, or inf if the goal is not reachable.
+        """
+        # Account for the moves of the start since the last search.
+        self.__km += abs(self.__lastStart[0] - self.start[0]) + abs(self.__lastStart[1] - self.start[1])
+        self.__lastStart = self.start
+
+        g, rhs = self.__g, self.__rhs
+        indexOf_s = self.maze.findIndexOfVertex(self.start)
+        while True:
+            kOld = self.__topKey()
+            if not (kOld < self.__calculateKey(indexOf_s) or rhs[indexOf_s] != g[indexOf_s]):
+                break
+            if kOld[0] == math.inf:
+                break
+            indexOf_u = heapq.heappop(self.__U)[2]
+            del self.__openKeys[indexOf_u]
+
+            kNew = self.__calculateKey(indexOf_u)
+            if kOld < kNew:
+                self.__insert(indexOf_u, kNew)
+            elif g[indexOf_u] > rhs[indexOf_u]:
+                g[indexOf_u] = rhs[indexOf_u]
+                for indexOf_v in self.maze.getNeighborIndices(indexOf_u):
+                    self.__updateVertex(indexOf_v)
+            else:
+                g[indexOf_u] = math.inf
+                self.__updateVertex(indexOf_u)
+                for indexOf_v in self.maze.getNeighborIndices(indexOf_u):
+                    self.__updateVertex(indexOf_v)
+        return g[indexOf_s]
+
+    def getPath(self):
+        """
+        Returns the shortest path from the start vertex to the goal vertex
+        found by the last call of computeShortestPath.
+
+        Returns:
+            list: The path as a list of indices, or None if the goal is not reachable.
+        """
+        g = self.__g
+        index = self.maze.findIndexOfVertex(self.start)
+        indexOf_r = self.maze.findIndexOfVertex(self.goal)
+        if g[index] == math.inf:
+            return None
+
+        path = [index]
+        while index != indexOf_r:
+            index = min(self.maze.getNeighborIndices(index), key=g.__getitem__)
+            path.append(index)
+        return path
@@ -1,7 +1,9 @@
 from Graph import Graph
+from GridVertices import GridVertices
+from WallGrid import WallGrid
+from Stats import Stats
 import numpy as np
-
-import matplotlib.pyplot as plt
+import time
 
 class Maze:
     """
@@ -10,38 +12,92 @@ class Maze:
     Attributes:
         __rows (int): The number of rows in the maze.
         __cols (int): The number of columns in the maze.
-        vertices (list): The list of vertices in the maze.
-        walls (list): The list of walls in the maze.
+        vertices (GridVertices): The vertices in the maze, indexed as x * cols + y.
+        walls (WallGrid): The walls in the maze, stored as north and east wall grids.
 
     Methods:
-        __init__(self, rows=12, cols=12): Initializes a new instance of the Maze class.
+        __init__(self, rows=12, cols=12, walls=None): Initializes a new instance of the Maze class.
+        fromFile(path, mode='r'): Opens a maze whose walls are stored in a .npy file.
         getRows(self): Returns the number of rows in the maze.
         getCols(self): Returns the number of columns in the maze.
         copy(self): Creates a copy of the maze.
         __initMaze(self): Initializes the maze by creating vertices and walls.
-        __north(self, xind, yind): Returns the north neighbor of a vertex.
-        __east(self, xind, yind): Returns the east neighbor of a vertex.
         isVertex(self, node): Checks if a node is a valid vertex in the maze.
         hasWall(self, wall): Checks if a wall exists in the maze.
         findIndexOfVertex(self, v): Finds the index of a vertex in the maze.
         getNeighborVertices(self, vertex): Returns the indices of the neighboring vertices of a given vertex.
-        converToGraph(self): Converts the maze to a graph representation.
-        plot(self, vertexFlag=False): Plots the maze.
+        getNeighborIndices(self, index): Returns the indices of the neighboring vertices of the vertex with the given index.
+        converToGraph(self): Converts the maze to a graph representation, cached until the walls change.
+        __wallSegments(self): Returns the line segments of every possible wall of the maze.
+        plot(self, vertexFlag=False, changedWalls=None): Plots the maze and keeps the artist of the walls to update it.
     """
 
-    def __init__(self, rows=12, cols=12):
+    def __init__(self, rows=12, cols=12, walls=None):
         """
         Initializes a new instance of the Maze class.
 
         Args:
             rows (int): The number of rows in the maze. Default is 12.
             cols (int): The number of columns in the maze. Default is 12.
+            walls (WallGrid): Existing walls to share. Default is None, which
+                puts a wall between every pair of neighboring vertices.
         """
         self.__rows = rows
         self.__cols = cols
-        self.vertices = []
-        self.walls = []
-        self.__initMaze()
+        self.vertices = GridVertices(rows, cols)
+        self.__plotAxes = None
+        # The last graph of the maze and the version of the walls it was built from.
+        self.__graph = None
+        self.__graphVersion = None
+        if walls is None:
+            self.__walls = WallGrid(rows, cols)
+            self.__initMaze()
+        else:
+            self.__walls = walls
+
+    @staticmethod
+    def fromFile(path, mode='r'):
+        """
+        Opens a maze whose walls are stored in a .npy file of shape (2, rows, cols),
+        with the north walls first and the east walls second. The file is memory
+        mapped, so rows are paged in only when they are used.
+
+        Args:
+            path (str): The path of the file.
+            mode (str): The memory map mode, 'r' for read-only or 'r+' to allow changes. Default is 'r'.
+
+        Returns:
+            Maze: The maze backed by the file.
+        """
+        grids = np.load(path, mmap_mode=mode)
+        _, rows, cols = grids.shape
+        return Maze(rows, cols, WallGrid(rows, cols, north=grids[0], east=grids[1]))
+
+    @property
+    def walls(self):
+        """
+        The walls in the maze.
+
+        Returns:
+            WallGrid: The walls, which can also be used as a list of ((x, y), (x, y)) tuples.
+        """
+        return self.__walls
+
+    @walls.setter
+    def walls(self, walls):
+        """
+        Sets the walls in the maze.
+
+        Args:
+            walls (WallGrid or iterable): A wall grid to share, or an iterable of ((x, y), (x, y)) tuples.
+        """
+        if not isinstance(walls, WallGrid):
+            grid = WallGrid(self.__rows, self.__cols)
+            for wall in walls:
+                grid.append(wall)
+            walls = grid
+        self.__walls = walls
+        self.__graph = None
 
     def getRows(self):
         """
@@ -68,58 +124,19 @@ class Maze:
         Returns:
             Maze: A copy of the maze.
         """
-        copyMaze = Maze(self.__rows, self.__cols)
+        stats = Stats.active
+        if stats is not None:
+            stats.count('mazeCopies')
+        copyMaze = Maze(self.__rows, self.__cols, self.walls)
         copyMaze.vertices = self.vertices
-        copyMaze.walls = self.walls
         return copyMaze
 
     def __initMaze(self):
         """
         Initializes the maze by creating vertices and walls.
         """
-        for xind in range(self.__rows):
-            for yind in range(self.__cols):
-                self.vertices.append((xind, yind))
-
-        # Traverse north first.
-        for pt in self.vertices:
-            vtn = self.__north(pt[0], pt[1])
-            if self.isVertex(vtn):
-                self.walls.append((pt, vtn))
-
-        # Traverse east second.
-        for pt in self.vertices:
-            vte = self.__east(pt[0], pt[1])
-            if self.isVertex(vte):
-                self.walls.append((pt, vte))
-
-    def __north(self, xind, yind):
-        """
-        Returns the north neighbor of a vertex.
-
-        Args:
-            xind (int): The x-coordinate of the vertex.
-            yind (int): The y-coordinate of the vertex.
-
-        Returns:
-            tuple: The coordinates of the north neighbor.
-        """
-        node = (xind, yind + 1)
-        return node
-
-    def __east(self, xind, yind):
-        """
-        Returns the east neighbor of a vertex.
-
-        Args:
-            xind (int): The x-coordinate of the vertex.
-            yind (int): The y-coordinate of the vertex.
-
-        Returns:
-            tuple: The coordinates of the east neighbor.
-        """
-        node = (xind + 1, yind)
-        return node
+        # Put a wall between every pair of neighboring vertices.
+        self.__walls.fill()
 
     def isVertex(self, node):
         """
@@ -131,11 +148,11 @@ class Maze:
         Returns:
             bool: True if the node is a vertex, False otherwise.
         """
-        return node in self.vertices
+        return self.vertices.findIndex(node) >= 0
 
     def hasWall(self, wall):
         """
-        Checks if a wall exists in the maze.
+        Checks if a wall exists in the maze, regardless of the order of its vertices.
 
         Args:
             wall (tuple): The wall to check.
@@ -147,7 +164,7 @@ class Maze:
 
     def findIndexOfVertex(self, v):
         """
-        Finds the index of a vertex in the maze.
+        Finds the index of a vertex in the maze. The index is x * cols + y.
 
         Args:
             v (tuple): The coordinates of the vertex.
@@ -155,10 +172,7 @@ class Maze:
         Returns:
             int: The index of the vertex, or -1 if not found.
         """
-        for i, vertex in enumerate(self.vertices):
-            if np.array_equal(vertex, v):
-                return i
-        return -1
+        return self.vertices.findIndex(v)
 
     def getNeighborVertices(self, vertex):
         """
@@ -175,46 +189,145 @@ class Maze:
         for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
             x, y = i + dx, j + dy
             neighbor = (x, y)
-            if (vertex, neighbor) in self.walls or (neighbor, vertex) in self.walls:
+            if self.hasWall((vertex, neighbor)):
                 continue
             if self.isVertex(neighbor):
                 neighborVertices.append(self.findIndexOfVertex(neighbor))
         return neighborVertices
 
+    def getNeighborIndices(self, index):
+        """
+        Returns the indices of the neighboring vertices of the vertex with the
+        given index. It reads the wall grids directly, so it is the fast
+        version of getNeighborVertices for code that works with indices.
+
+        Args:
+            index (int): The index of the vertex.
+
+        Returns:
+            list: The indices of the neighboring vertices.
+        """
+        rows, cols = self.__rows, self.__cols
+        north, east = self.walls.north, self.walls.east
+        x, y = divmod(index, cols)
+        neighborIndices = []
+        if x < rows - 1 and not east[x, y]:
+            neighborIndices.append(index + cols)
+        if x > 0 and not east[x - 1, y]:
+            neighborIndices.append(index - cols)
+        if y < cols - 1 and not north[x, y]:
+            neighborIndices.append(index + 1)
+        if y > 0 and not north[x, y - 1]:
+            neighborIndices.append(index - 1)
+        return neighborIndices
+
     def converToGraph(self):
         """
-        Converts the maze to a graph representation.
+        Converts the maze to a graph representation. The adjacency is built in
+        one vectorized pass over the wall grids. The graph is kept and returned
+        again until the version of the walls changes, so it must not be modified.
 
         Returns:
             Graph: The graph representation of the maze.
         """
-        edges = []
-        for vertex in self.vertices:
-            for neighbor_id in self.getNeighborVertices(vertex):
-                edges.append((self.findIndexOfVertex(vertex), neighbor_id))
-
-        graph = Graph(self.vertices, edges)
+        if self.__graph is not None and self.__graphVersion == self.__walls.version:
+            return self.__graph
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        rows, cols = self.__rows, self.__cols
+        north, east = self.walls.north, self.walls.east
+        indices = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+
+        # Neighbor of every vertex in each direction, in the same order as
+        # getNeighborVertices (east, west, north, south), or -1 if blocked.
+        neighbors = np.full((rows, cols, 4), -1, dtype=np.int32)
+        neighbors[:-1, :, 0] = np.where(east[:-1, :], -1, indices[1:, :])
+        neighbors[1:, :, 1] = np.where(east[:-1, :], -1, indices[:-1, :])
+        neighbors[:, :-1, 2] = np.where(north[:, :-1], -1, indices[:, 1:])
+        neighbors[:, 1:, 3] = np.where(north[:, :-1], -1, indices[:, :-1])
+        neighbors = neighbors.reshape(-1, 4)
+
+        isOpen = neighbors >= 0
+        offsets = np.zeros(rows * cols + 1, dtype=np.int32)
+        np.cumsum(np.count_nonzero(isOpen, axis=1), out=offsets[1:])
+
+        graph = Graph(self.vertices, offsets=offsets, neighbors=neighbors[isOpen])
+        self.__graph = graph
+        self.__graphVersion = self.__walls.version
+        if stats is not None:
+            stats.count('graphBuilds')
+            stats.addTime('converToGraph', time.perf_counter() - startTime)
         return graph
 
-    def plot(self, vertexFlag=False):
+    def __wallSegments(self):
         """
-        Plots the maze.
+        Returns the line segments of every possible wall of the maze, the north
+        walls first and the east walls second, in the order of the vertex indices.
+
+        Returns:
+            numpy.ndarray: The segments as an array of shape (2 * rows * cols, 2, 2).
+        """
+        x, y = np.meshgrid(np.arange(self.__rows), np.arange(self.__cols), indexing='ij')
+        x, y = x.reshape(-1), y.reshape(-1)
+        # A wall is drawn across the middle of the passage it closes.
+        north = np.stack((np.stack((x - 0.5, y + 0.5), axis=1), np.stack((x + 0.5, y + 0.5), axis=1)), axis=1)
+        east = np.stack((np.stack((x + 0.5, y - 0.5), axis=1), np.stack((x + 0.5, y + 0.5), axis=1)), axis=1)
+        return np.concatenate((north, east))
+
+    def plot(self, vertexFlag=False, changedWalls=None):
+        """
+        Plots the maze. All walls are drawn as one LineCollection with a segment
+        for every possible wall, and missing walls are transparent. The artist is
+        kept, so plotting again on the same axes only recolors the segments of
+        the walls that changed since the last plot.
 
         Args:
             vertexFlag (bool): Whether to plot the vertices of the maze.
+            changedWalls (list): The walls that changed since the last plot, if known.
+                Default is None, which compares all walls with the plotted ones.
         """
-        # Plot the walls of the maze.
-        for e in self.walls:
-            vec = np.array([e[1][0] - e[0][0], e[1][1] - e[0][1]])
-            ort = np.array([-vec[1], vec[0]])
-            olen = np.linalg.norm(ort)
-            ort = ort / olen
-            sum = np.array([(e[1][0] + e[0][0]) / 2, (e[1][1] + e[0][1]) / 2])
-            startp = sum - ort / 2
-            endp = sum + ort / 2
-            plt.plot((startp[0], endp[0]), (startp[1], endp[1]), 'gray', linewidth=10)
-
-        # Plot the vertices of the maze if vertexFlag is True.
-        if vertexFlag:
-            for v in self.vertices:
-                plt.plot(float(v[0]), float(v[1]), 'ro')
+        # Imported here so that headless runs never load matplotlib.
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba
+
+        axes = plt.gca()
+        if self.__plotAxes is axes and changedWalls is not None:
+            # Recolor only the given walls. The north wall of vertex v is segment v
+            # and its east wall is segment rows * cols + v.
+            cols = self.__cols
+            for (a, b) in changedWalls:
+                index = min(a[0] * cols + a[1], b[0] * cols + b[1])
+                segment = index if a[0] == b[0] else self.__rows * cols + index
+                isWall = self.hasWall((a, b))
+                self.__plottedWalls[segment] = isWall
+                self.__wallColors[segment] = to_rgba('gray') if isWall else 0
+            if changedWalls:
+                self.__wallCollection.set_color(self.__wallColors)
+            return
+
+        walls = np.concatenate((self.walls.north.reshape(-1), self.walls.east.reshape(-1)))
+        if self.__plotAxes is not axes:
+            # Plot the walls of the maze.
+            self.__plotAxes = axes
+            self.__plottedWalls = walls.copy()
+            self.__wallColors = np.zeros((len(walls), 4))
+            self.__wallColors[walls] = to_rgba('gray')
+            self.__wallCollection = LineCollection(self.__wallSegments(), colors=self.__wallColors, linewidths=10)
+            axes.add_collection(self.__wallCollection)
+            axes.autoscale_view()
+
+            # Plot the vertices of the maze if vertexFlag is True.
+            if vertexFlag:
+                x, y = np.divmod(np.arange(self.__rows * self.__cols), self.__cols)
+                axes.plot(x, y, 'ro', linestyle='none')
+        else:
+            # Recolor only the walls that changed.
+            changed = np.flatnonzero(walls != self.__plottedWalls)
+            if len(changed):
+                self.__wallColors[changed] = 0
+                self.__wallColors[changed[walls[changed]]] = to_rgba('gray')
+                self.__plottedWalls[changed] = walls[changed]
+                self.__wallCollection.set_color(self.__wallColors)
+
@@ -1,30 +1,92 @@
 from RandomNumberGenerator import RandomNumberGenerator
 from Maze import Maze
+from EllerMazeGenerator import EllerMazeGenerator
+from Stats import Stats
+import math
+import numpy as np
+import time
 
 class MazeGenerator:
     """
     This class represents a maze generator.
 
+    The generation algorithms are kept in the ALGORITHMS registry, which maps
+    a name to a function that takes the generator and carves its maze. All of
+    them produce perfect mazes, in which every two cells are connected by
+    exactly one path. The DRAW_BUDGETS registry maps a name to a function of
+    the maze size that gives the number of random numbers the algorithm draws
+    at most, so that a stream of that length can be set aside for it.
+
     Attributes:
         maze (Maze): The maze object.
+        algorithm (str): The name of the generation algorithm.
+        generationTime (float): The time the last generation took in seconds, or None.
         __randomNumberGenerator (RandomNumberGenerator): The random number generator object.
 
     Methods:
-        __init__(self, rows=12, cols=12): Initializes a MazeGenerator object.
+        __init__(self, rows=12, cols=12, algorithm='prim', randomNumberGenerator=None): Initializes a MazeGenerator object.
+        registerAlgorithm(name, generate, budget=None): Adds a generation algorithm to the registry.
+        drawBudget(rows, cols, algorithm): Returns the number of random numbers a generation draws at most.
         __randomItem(self, fromList): Returns a random item from a given list.
-        generateMaze(self): Generates a maze using the randomized Prim's algorithm.
+        __randomBlock(self, n): Returns the next n random numbers as an array.
+        generateMaze(self): Generates a maze using the selected algorithm.
+        __generatePrim(self): Generates a maze using the randomized Prim's algorithm.
+        __generateBinaryTree(self): Generates a maze using the binary tree algorithm.
+        __generateSidewinder(self): Generates a maze using the sidewinder algorithm.
+        __generateWilson(self): Generates a maze using Wilson's algorithm.
+        __generateEller(self): Generates a maze line by line using Eller's algorithm.
     """
 
-    def __init__(self, rows=12, cols=12):
+    def __init__(self, rows=12, cols=12, algorithm='prim', randomNumberGenerator=None):
         """
         Initializes a MazeGenerator object.
 
         Args:
             rows (int): The number of rows in the maze. Default is 12.
             cols (int): The number of columns in the maze. Default is 12.
+            algorithm (str): The name of the generation algorithm in ALGORITHMS. Default is 'prim'.
+            randomNumberGenerator (RandomNumberGenerator): The random number generator to draw from.
+                Default is None, which creates a new one.
         """
+        assert algorithm in MazeGenerator.ALGORITHMS, f"The algorithm should be one of {list(MazeGenerator.ALGORITHMS)}."
         self.maze = Maze(rows, cols)
-        self.__randomNumberGenerator = RandomNumberGenerator()
+        self.algorithm = algorithm
+        self.generationTime = None
+        if randomNumberGenerator is None:
+            randomNumberGenerator = RandomNumberGenerator()
+        self.__randomNumberGenerator = randomNumberGenerator
+
+    @staticmethod
+    def registerAlgorithm(name, generate, budget=None):
+        """
+        Adds a generation algorithm to the registry.
+
+        Args:
+            name (str): The name of the algorithm.
+            generate (function): A function that takes the MazeGenerator and removes
+                walls from its maze, which starts with every wall in place.
+            budget (function): A function that takes the numbers of rows and columns and
+                returns the number of random numbers the algorithm draws at most. Default
+                is None, which allows as many as Wilson's algorithm.
+        """
+        MazeGenerator.ALGORITHMS[name] = generate
+        if budget is not None:
+            MazeGenerator.DRAW_BUDGETS[name] = budget
+
+    @staticmethod
+    def drawBudget(rows, cols, algorithm='prim'):
+        """
+        Returns the number of random numbers a generation draws at most.
+
+        Args:
+            rows (int): The number of rows in the maze.
+            cols (int): The number of columns in the maze.
+            algorithm (str): The name of the generation algorithm. Default is 'prim'.
+
+        Returns:
+            int: The number of random numbers.
+        """
+        return MazeGenerator.DRAW_BUDGETS.get(algorithm, MazeGenerator.DRAW_BUDGETS['wilson'])(rows, cols)
 
     def __randomItem(self, fromList):
         """
@@ -36,55 +98,253 @@ class MazeGenerator:
         Returns:
             object: A random item from the list.
         """
-        randind = (self.__randomNumberGenerator.generate() % len(list(fromList)))
-        return list(fromList)[randind]
+        randind = (self.__randomNumberGenerator.generate() % len(fromList))
+        return fromList[randind]
+
+    def __randomBlock(self, n):
+        """
+        Returns the next n random numbers as an array.
+
+        Args:
+            n (int): The number of random numbers.
+
+        Returns:
+            numpy.ndarray: The random numbers.
+        """
+        return self.__randomNumberGenerator.generateBlock(n)
 
     def generateMaze(self):
+        """
+        Generates a maze using the selected algorithm and records how long it took.
+
+        Returns:
+            Maze: The generated maze.
+        """
+        startTime = time.perf_counter()
+        MazeGenerator.ALGORITHMS[self.algorithm](self)
+        # The algorithms carve into the wall arrays directly.
+        self.maze.walls.markChanged()
+        self.generationTime = time.perf_counter() - startTime
+        if Stats.active is not None:
+            Stats.active.addTime('generateMaze', self.generationTime)
+        return self.maze
+
+    def __generatePrim(self):
         """
         Generates a maze using the randomized Prim's algorithm.
 
+        Walls are identified by integers: the north wall of the vertex with
+        index v is v and its east wall is rows * cols + v. The frontier is a
+        list of wall ids, a random wall is taken out of it by swapping it with
+        the last one, and the vertices on both sides of a wall are computed
+        arithmetically, so every step is O(1).
+
         Returns:
             Maze: The generated maze.
         """
         assert(type(self.maze == Maze)), "The self maze should be type Maze."
+        rows, cols = self.maze.getRows(), self.maze.getCols()
+        vertexCount = rows * cols
 
         # Visited cells C from Vertexes of G.
         # All cells are unvisited.
-        C = set()
+        C = bytearray(vertexCount)
 
-        # All connections have walls.
-        W = self.maze.walls.copy()
+        # Walls that are in the frontier or were in it once.
+        seen = bytearray(2 * vertexCount)
 
-        # Set of walls to check out L.
-        L = set()
+        # Set of walls to check out L, and the walls that get removed.
+        L = []
+        removed = []
 
-        # Select c € V randomly.
-        c = self.__randomItem(self.maze.vertices)
+        def visit(v):
+            # Mark v visited and add its walls to unvisited neighbours to L.
+            C[v] = 1
+            x, y = divmod(v, cols)
+            if y < cols - 1 and not C[v + 1] and not seen[v]:
+                seen[v] = 1
+                L.append(v)
+            if y > 0 and not C[v - 1] and not seen[v - 1]:
+                seen[v - 1] = 1
+                L.append(v - 1)
+            if x < rows - 1 and not C[v + cols] and not seen[vertexCount + v]:
+                seen[vertexCount + v] = 1
+                L.append(vertexCount + v)
+            if x > 0 and not C[v - cols] and not seen[vertexCount + v - cols]:
+                seen[vertexCount + v - cols] = 1
+                L.append(vertexCount + v - cols)
 
-        # Initialize L with the neighbours of c.
-        for w in W:
-            if c in w:
-                L.add(w)
+        # Select c € V randomly.
+        c = self.maze.findIndexOfVertex(self.__randomItem(self.maze.vertices))
+        visit(c)
 
+        # The random numbers are drawn in blocks and used one per step.
+        randomNumbers = []
         while L:
-            # Select l € L randomly.
-            l = self.__randomItem(L)
-
-            if not l in C:
-                # Both ends not already visited.
-                if(len(set(l).intersection(C)) <= 1):
-                    for endPt in l:
-                        C.add(endPt)
-
-                    # Remove the wall.
-                    W.remove(l)
-
-                    # Add neighbouring walls.
-                    for w in W:
-                        if len(set(w).intersection(l)) != 0:
-                            if not w in L:
-                                L.add(w)
-            L.remove(l)
-
-        self.maze.walls = W
+            if not randomNumbers:
+                randomNumbers = self.__randomBlock(4096).tolist()[::-1]
+
+            # Select l € L randomly and take it out of L.
+            randind = randomNumbers.pop() % len(L)
+            l = L[randind]
+            L[randind] = L[-1]
+            L.pop()
+
+            # Vertices on both sides of the wall.
+            if l < vertexCount:
+                a, b = l, l + 1
+            else:
+                a = l - vertexCount
+                b = a + cols
+
+            # Only one end already visited.
+            if C[a] != C[b]:
+                # Remove the wall and add the neighbouring walls.
+                removed.append(l)
+                visit(b if C[a] else a)
+
+        removed = np.array(removed, dtype=np.int64)
+        self.maze.walls.north.reshape(-1)[removed[removed < vertexCount]] = False
+        self.maze.walls.east.reshape(-1)[removed[removed >= vertexCount] - vertexCount] = False
+        return self.maze
+
+    def __generateBinaryTree(self):
+        """
+        Generates a maze using the binary tree algorithm. Every cell opens the
+        passage to its north or to its east neighbour at random, which is done
+        for the whole grid at once. Cells on the last row or column have only
+        one choice.
+
+        Returns:
+            Maze: The generated maze.
+        """
+        rows, cols = self.maze.getRows(), self.maze.getCols()
+        carveNorth = (self.__randomBlock(rows * cols) % 2 == 0).reshape(rows, cols)
+        carveNorth[:, cols - 1] = False
+        carveNorth[rows - 1, :cols - 1] = True
+        carveEast = ~carveNorth
+        carveEast[rows - 1, :] = False
+
+        self.maze.walls.north[carveNorth] = False
+        self.maze.walls.east[carveEast] = False
+        return self.maze
+
+    def __generateSidewinder(self):
+        """
+        Generates a maze using the sidewinder algorithm. Each line of constant y
+        is split into runs that are open to the east, and every run opens one
+        random passage to the north. The last line is one long run. Runs of all
+        lines are found at once with cumulative sums.
+
+        Returns:
+            Maze: The generated maze.
+        """
+        rows, cols = self.maze.getRows(), self.maze.getCols()
+        north, east = self.maze.walls.north, self.maze.walls.east
+        east[:rows - 1, cols - 1] = False
+        if cols == 1:
+            return self.maze
+
+        # Close the run after a cell at random, and always at the end of a line.
+        # The lines are laid out one after the other as y * rows + x.
+        closeRun = (self.__randomBlock((cols - 1) * rows) % 2 == 0).reshape(cols - 1, rows)
+        closeRun[:, rows - 1] = True
+        east[:rows - 1, :cols - 1] = closeRun[:, :rows - 1].T
+
+        closeRun = closeRun.reshape(-1)
+        runLengths = np.diff(np.flatnonzero(closeRun), prepend=-1)
+        runStarts = np.cumsum(runLengths) - runLengths
+        carved = runStarts + self.__randomBlock(len(runLengths)) % runLengths
+        north[carved % rows, carved // rows] = False
         return self.maze
+
+    def __generateWilson(self):
+        """
+        Generates a maze using Wilson's algorithm. From every cell outside the
+        maze a random walk runs until it hits the maze, and its loop-erased path
+        is added. The walk is sequential, but its random directions are drawn in
+        blocks. The mazes are uniform spanning trees.
+
+        Returns:
+            Maze: The generated maze.
+        """
+        rows, cols = self.maze.getRows(), self.maze.getCols()
+        vertexCount = rows * cols
+        inMaze = bytearray(vertexCount)
+        # Step taken from every cell on the current walk; a later step overwrites
+        # an earlier one, which erases the loops.
+        nextCell = [0] * vertexCount
+        removedNorth = []
+        removedEast = []
+        randomNumbers = []
+
+        inMaze[self.__randomNumberGenerator.generate() % vertexCount] = 1
+        for start in range(vertexCount):
+            v = start
+            while not inMaze[v]:
+                if not randomNumbers:
+                    randomNumbers = self.__randomBlock(4096).tolist()[::-1]
+                x, y = divmod(v, cols)
+                neighbours = []
+                if y < cols - 1:
+                    neighbours.append(v + 1)
+                if y > 0:
+                    neighbours.append(v - 1)
+                if x < rows - 1:
+                    neighbours.append(v + cols)
+                if x > 0:
+                    neighbours.append(v - cols)
+                nextCell[v] = neighbours[randomNumbers.pop() % len(neighbours)]
+                v = nextCell[v]
+
+            # Add the loop-erased walk to the maze.
+            v = start
+            while not inMaze[v]:
+                inMaze[v] = 1
+                u = nextCell[v]
+                low = min(u, v)
+                if abs(u - v) == cols:
+                    removedEast.append(low)
+                else:
+                    removedNorth.append(low)
+                v = u
+
+        self.maze.walls.north.reshape(-1)[np.array(removedNorth, dtype=np.int64)] = False
+        self.maze.walls.east.reshape(-1)[np.array(removedEast, dtype=np.int64)] = False
+        return self.maze
+
+    def __generateEller(self):
+        """
+        Generates a maze line by line using Eller's algorithm. The lines come
+        from EllerMazeGenerator, which can also stream them into a file for
+        mazes that do not fit in memory.
+
+        Returns:
+            Maze: The generated maze.
+        """
+        ellerMazeGenerator = EllerMazeGenerator(self.maze.getRows(), self.maze.getCols(), self.__randomNumberGenerator)
+        for x, north, east in ellerMazeGenerator.generateRows():
+            self.maze.walls.north[x] = north
+            self.maze.walls.east[x] = east
+        return self.maze
+
+    ALGORITHMS = {
+        'prim': __generatePrim,
+        'binary-tree': __generateBinaryTree,
+        'sidewinder': __generateSidewinder,
+        'wilson': __generateWilson,
+        'eller': __generateEller,
+    }
+
+    # Prim's algorithm and Wilson's algorithm draw blocks of 4096 numbers. Prim
+    # uses one number per wall and every wall enters its list once. Wilson's
+    # random walks have no upper bound, so its budget of 64 steps per cell is
+    # far above the usual length of the walks, and a walk past it stops the
+    # generation with an error instead of drawing from the next stream.
+    DRAW_BUDGETS = {
+        'prim': lambda rows, cols: 1 + math.ceil((rows * (cols - 1) + cols * (rows - 1)) / 4096) * 4096,
+        'binary-tree': lambda rows, cols: rows * cols,
+        'sidewinder': lambda rows, cols: 2 * rows * cols,
+        'wilson': lambda rows, cols: 1 + math.ceil(64 * rows * cols / 4096) * 4096,
+        'eller': lambda rows, cols: 3 * rows * cols,
+    }
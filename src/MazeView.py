@@ -0,0 +1,70 @@
+from Maze import Maze
+
+class MazeView(Maze):
+    """
+    A read-only view of a live maze.
+
+    The view shares the walls and the vertices of the maze, so it always shows
+    the current walls without copying them, and it asks the maze for its
+    graph, so every view of a maze shares the graph the maze caches until the
+    version of its walls changes. Creating a view is O(1). The walls of a view
+    cannot be replaced.
+
+    Attributes:
+        maze (Maze): The maze the view shows.
+        version (int): The version of the walls the view currently shows.
+
+    Methods:
+        __init__(self, maze): Initializes a new instance of the MazeView class.
+        converToGraph(self): Returns the cached graph of the maze.
+    """
+
+    def __init__(self, maze : Maze):
+        """
+        Initializes a new instance of the MazeView class.
+
+        Args:
+            maze (Maze): The maze to show.
+        """
+        super().__init__(maze.getRows(), maze.getCols(), maze.walls)
+        self.vertices = maze.vertices
+        self.maze = maze
+
+    @property
+    def walls(self):
+        """
+        The walls of the maze.
+
+        Returns:
+            WallGrid: The walls, shared with the maze.
+        """
+        return self.maze.walls
+
+    @walls.setter
+    def walls(self, walls):
+        """
+        Refuses to replace the walls, since the view is read-only.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError("The walls of a MazeView cannot be replaced.")
+
+    @property
+    def version(self):
+        """
+        The version of the walls the view currently shows.
+
+        Returns:
+            int: The version of the walls.
+        """
+        return self.maze.walls.version
+
+    def converToGraph(self):
+        """
+        Returns the graph of the maze, which is built only once per version of the walls.
+
+        Returns:
+            Graph: The graph representation of the maze.
+        """
+        return self.maze.converToGraph()
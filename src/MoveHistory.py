@@ -0,0 +1,182 @@
+from array import array
+
+class MoveHistory:
+    """
+    This class stores the positions a pawn visited in compact form.
+
+    Only the oldest kept position is stored as a vertex. The moves after it
+    are stored as runs of equal directions, with one byte for the direction
+    and one integer for the length of every run, so a pawn that walks along
+    a corridor costs a single run. With a capacity, the oldest positions are
+    dropped once more than capacity positions are kept, like a ring buffer,
+    which bounds the memory of very long runs. Appending is O(1) amortized.
+
+    Attributes:
+        capacity (int): The maximum number of positions kept, or None for no limit.
+        totalMoves (int): The number of moves appended so far, including dropped ones.
+
+    Methods:
+        __init__(self, start, capacity=None): Initializes a MoveHistory object.
+        append(self, position): Adds the position after a move to a neighbouring vertex.
+        runs(self): Returns the runs of the kept moves.
+        tolist(self): Returns the kept positions as a list.
+        tail(self, n): Returns the newest n kept positions as a list.
+        __len__(self): Returns the number of kept positions.
+        __getitem__(self, i): Returns the kept position with the given index.
+        __iter__(self): Iterates over the kept positions from the oldest.
+    """
+
+    # The vertex offsets of the four directions.
+    DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+    def __init__(self, start, capacity=None):
+        """
+        Initializes a MoveHistory object.
+
+        Args:
+            start (tuple): The first position.
+            capacity (int): The maximum number of positions kept. Default is None, which means no limit.
+        """
+        assert capacity is None or capacity >= 1, "The capacity should be at least 1."
+        self.capacity = capacity
+        self.totalMoves = 0
+        self.__first = tuple(start)
+        self.__last = tuple(start)
+        self.__directions = array('b')
+        self.__lengths = array('i')
+        # Index of the oldest kept run and the number of kept moves.
+        self.__head = 0
+        self.__moves = 0
+
+    def append(self, position):
+        """
+        Adds the position after a move to a neighbouring vertex.
+
+        Args:
+            position (tuple): The new position.
+        """
+        direction = MoveHistory.DIRECTIONS.index((position[0] - self.__last[0], position[1] - self.__last[1]))
+        if len(self.__directions) > self.__head and self.__directions[-1] == direction:
+            self.__lengths[-1] += 1
+        else:
+            self.__directions.append(direction)
+            self.__lengths.append(1)
+        self.__last = tuple(position)
+        self.__moves += 1
+        self.totalMoves += 1
+        if self.capacity is not None and self.__moves + 1 > self.capacity:
+            self.__dropFirst()
+
+    def __dropFirst(self):
+        """
+        Drops the oldest kept position. Dropped runs are removed from the
+        arrays only when they make up more than half of them, so that dropping
+        is O(1) amortized.
+        """
+        head = self.__head
+        dx, dy = MoveHistory.DIRECTIONS[self.__directions[head]]
+        self.__first = (self.__first[0] + dx, self.__first[1] + dy)
+        self.__lengths[head] -= 1
+        self.__moves -= 1
+        if self.__lengths[head] == 0:
+            self.__head += 1
+            if self.__head > 64 and 2 * self.__head > len(self.__directions):
+                del self.__directions[:self.__head]
+                del self.__lengths[:self.__head]
+                self.__head = 0
+
+    def runs(self):
+        """
+        Returns the runs of the kept moves.
+
+        Returns:
+            list: The runs as (direction offset, length) pairs, from the oldest.
+        """
+        return [(MoveHistory.DIRECTIONS[direction], length) for direction, length in
+                zip(self.__directions[self.__head:], self.__lengths[self.__head:])]
+
+    def tolist(self):
+        """
+        Returns the kept positions as a list.
+
+        Returns:
+            list: The positions, from the oldest.
+        """
+        return list(self)
+
+    def tail(self, n):
+        """
+        Returns the newest n kept positions. Only the runs that hold them are
+        walked, backwards from the last position, so the cost does not depend
+        on the number of older positions.
+
+        Args:
+            n (int): The number of positions.
+
+        Returns:
+            list: The positions, from the oldest of them.
+        """
+        n = min(n, len(self))
+        if n <= 0:
+            return []
+        x, y = self.__last
+        positions = [(x, y)]
+        for i in range(len(self.__directions) - 1, self.__head - 1, -1):
+            dx, dy = MoveHistory.DIRECTIONS[self.__directions[i]]
+            for _ in range(self.__lengths[i]):
+                if len(positions) == n:
+                    return positions[::-1]
+                x, y = x - dx, y - dy
+                positions.append((x, y))
+        return positions[::-1]
+
+    def __len__(self):
+        """
+        Returns the number of kept positions.
+
+        Returns:
+            int: The number of positions.
+        """
+        return self.__moves + 1
+
+    def __getitem__(self, i):
+        """
+        Returns the kept position with the given index. The first and the last
+        positions are O(1), the others are found by walking the runs.
+
+        Args:
+            i (int): The index, negative indices count from the end.
+
+        Returns:
+            tuple: The position.
+        """
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("MoveHistory index out of range")
+        if i == 0:
+            return self.__first
+        if i == self.__moves:
+            return self.__last
+        x, y = self.__first
+        for (dx, dy), length in self.runs():
+            steps = min(i, length)
+            x, y = x + steps * dx, y + steps * dy
+            i -= steps
+            if i == 0:
+                break
+        return (x, y)
+
+    def __iter__(self):
+        """
+        Iterates over the kept positions from the oldest.
+
+        Yields:
+            tuple: The next position.
+        """
+        x, y = self.__first
+        yield (x, y)
+        for (dx, dy), length in self.runs():
+            for _ in range(length):
+                x, y = x + dx, y + dy
+                yield (x, y)
@@ -1,5 +1,67 @@
+from array import array
+from collections.abc import Mapping
+import heapq
 import math
+import time
 from Graph import Graph
+from GridVertices import GridVertices
+from Stats import Stats
+
+class PathMapping(Mapping):
+    """
+    Read-only mapping from vertex indices to the index of their parent in the search tree.
+
+    It wraps the flat parent array of a search, so it behaves like the dict
+    the search used to return: vertices without a parent map to None.
+
+    Attributes:
+        parents (array): The parent index of every vertex, or -1 if it has none.
+    """
+
+    def __init__(self, parents):
+        """
+        Initializes a PathMapping object.
+
+        Args:
+            parents (array): The parent index of every vertex, or -1 if it has none.
+        """
+        self.parents = parents
+
+    def __getitem__(self, index):
+        """
+        Returns the parent of a vertex in the search tree.
+
+        Args:
+            index (int): The index of the vertex.
+
+        Returns:
+            int: The index of the parent, or None if the vertex has no parent.
+
+        Raises:
+            KeyError: If the index is not the index of a vertex.
+        """
+        if not 0 <= index < len(self.parents):
+            raise KeyError(index)
+        parent = self.parents[index]
+        return None if parent < 0 else parent
+
+    def __iter__(self):
+        """
+        Iterates over the indices of all vertices, with or without a parent.
+
+        Returns:
+            iterator: The vertex indices in increasing order.
+        """
+        return iter(range(len(self.parents)))
+
+    def __len__(self):
+        """
+        Returns the number of vertices in the mapping.
+
+        Returns:
+            int: The number of vertices.
+        """
+        return len(self.parents)
 
 class PathFinder:
     """
@@ -15,8 +77,8 @@ class PathFinder:
         setStart(self, start): Sets the starting vertex.
         setGoal(self, goal): Sets the goal vertex.
         setGraph(self, graph : Graph): Sets the graph representing the maze.
-        __heuristicMeasure(self, v1, v2): Calculates the heuristic measure between two vertices.
-        getPathMapping(self): Finds the path mapping from the start vertex to the goal vertex.
+        __heuristicMeasure(self, v1, v2): Calculates the Manhattan distance between two vertices.
+        getPathMapping(self): Finds the path mapping from the start vertex to the goal vertex with A*.
     """
 class PathFinder:
     """
@@ -70,74 +132,101 @@ class PathFinder:
     
     def __heuristicMeasure(self, v1, v2):
         """
-        Calculates the heuristic measure between two vertices.
+        Calculates the heuristic measure between two vertices. The maze is
+        4-connected, so the Manhattan distance is admissible and tighter than
+        the Euclidean one.
 
         Args:
             v1 (tuple): The first vertex.
             v2 (tuple): The second vertex.
 
         Returns:
-            float: The heuristic measure.
+            int: The heuristic measure.
         """
-        return math.sqrt(pow((v1[0] - v2[0]), 2) + pow((v1[1] - v2[1]), 2))
-    
+        return abs(v1[0] - v2[0]) + abs(v1[1] - v2[1])
+
     def getPathMapping(self):
         """
         Finds the path mapping from the start vertex to the goal vertex.
 
+        The open list is a binary heap with lazy decrease-key: an improved
+        vertex is pushed again and outdated heap entries are skipped when popped.
+        If instrumentation is on, the search time, the expanded vertices and the
+        heap pushes are recorded in Stats.active.
+
         Returns:
-            dict: The path mapping.
+            PathMapping: The path mapping, or None if the goal is not reachable.
         """
         assert(self.graph.hasVertex(self.start) and self.graph.hasVertex(self.goal))
-
-        # pi -> mapping
-        pi = {}
-        # S  -> open list
-        S = set()
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+
+        vertices = self.graph.vertices
+        vertexCount = len(vertices)
+        offsets, neighbors = self.graph.getAdjacencyLists()
+        if isinstance(vertices, GridVertices):
+            cols = vertices.getCols()
+            coordinatesOf = lambda index: divmod(index, cols)
+        else:
+            coordinatesOf = vertices.__getitem__
+
+        # pi -> parent of every vertex, -1 if it is not reached yet.
+        pi = array('i', [-1]) * vertexCount
         # g  -> cost function
-        g = {}
-        # h  -> heuristic lower bound estimate
-        h = {}
+        g = array('d', [math.inf]) * vertexCount
+        # Vertices that are already expanded.
+        closed = bytearray(vertexCount)
 
         # Find the index of vertices.
         indexOf_s = self.graph.findIndexOfVertex(self.start)
         indexOf_r = self.graph.findIndexOfVertex(self.goal)
-
-        # Initialization.
-        for v in self.graph.vertices:
-            indexOf_v = self.graph.findIndexOfVertex(v)
-            g[(indexOf_s, indexOf_v)] = math.inf
-            pi[indexOf_v] = None
-
-        g[(indexOf_s, indexOf_s)] = 0
-        S.add(indexOf_s)
-        h[(indexOf_s, indexOf_r)] = self.__heuristicMeasure(self.start, self.goal)
+        rx, ry = coordinatesOf(indexOf_r)
+
+        # Initialization. S -> open list of (g + h, h, index) entries.
+        g[indexOf_s] = 0
+        h_s = self.__heuristicMeasure(coordinatesOf(indexOf_s), (rx, ry))
+        S = [(h_s, h_s, indexOf_s)]
+        def countingPush(heap, item):
+            stats.count('heapPushes')
+            heapq.heappush(heap, item)
+        # Only an instrumented search pays for counting the pushes.
+        heappush = countingPush if stats is not None else heapq.heappush
+        heappop = heapq.heappop
+        if stats is not None:
+            # The start vertex is the first push.
+            stats.count('heapPushes')
 
         # Search.
-        while len(S) > 0:
-            # Vertex vPrime € S that minimizes g(s->vPrime) + h(vPrime -> r)
-            minEstimation = math.inf
-            v = None
-            for indexOf_vPrime in S:
-                minEstimationPrime = g[(indexOf_s, indexOf_vPrime)] + h[(indexOf_vPrime, indexOf_r)]
-                if minEstimationPrime <= minEstimation:
-                    v = self.graph.vertices[indexOf_vPrime]
-                    minEstimation = minEstimationPrime
+        pathMapping = None
+        while S:
+            # Vertex v in S that minimizes g(s->v) + h(v -> r).
+            indexOf_v = heappop(S)[2]
+            if closed[indexOf_v]:
+                continue
 
             # Is the goal reached?
-            indexOf_v = self.graph.findIndexOfVertex(v)
             if indexOf_v == indexOf_r:
-                return pi
-
-            S.remove(indexOf_v)
-
-            # Open u.
-            for u in self.graph.getSuccessors(v):
-                indexOf_u = self.graph.findIndexOfVertex(u)
-                if (pi[indexOf_u] == None) or (indexOf_u in S and (g[(indexOf_s, indexOf_v)] + self.__heuristicMeasure(v, u) < g[(indexOf_s,indexOf_u)])):
-                    S.add(indexOf_u)
-                    g[(indexOf_s, indexOf_u)] = g[(indexOf_s, indexOf_v)] + self.__heuristicMeasure(v, u)
+                pathMapping = PathMapping(pi)
+                break
+
+            closed[indexOf_v] = 1
+            vx, vy = coordinatesOf(indexOf_v)
+            g_v = g[indexOf_v]
+
+            # Open u. Both the edge cost and h(u -> r) are Manhattan distances.
+            for indexOf_u in neighbors[offsets[indexOf_v]:offsets[indexOf_v + 1]]:
+                if closed[indexOf_u]:
+                    continue
+                ux, uy = coordinatesOf(indexOf_u)
+                g_u = g_v + abs(vx - ux) + abs(vy - uy)
+                if g_u < g[indexOf_u]:
+                    g[indexOf_u] = g_u
                     pi[indexOf_u] = indexOf_v
-                    h[(indexOf_u, indexOf_r)] = self.__heuristicMeasure(u, self.goal)
+                    h_u = abs(ux - rx) + abs(uy - ry)
+                    heappush(S, (g_u + h_u, h_u, indexOf_u))
 
-        return None
+        if stats is not None:
+            stats.count('nodesExpanded', closed.count(1) + (pathMapping is not None))
+            stats.addTime('getPathMapping', time.perf_counter() - startTime)
+        return pathMapping
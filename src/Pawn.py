@@ -1,6 +1,9 @@
 from PathFinder import PathFinder
+from IncrementalPathFinder import IncrementalPathFinder
+from DistanceField import DistanceField
 from Maze import Maze
-import matplotlib.pyplot as plt
+from MoveHistory import MoveHistory
+import numpy as np
 
 class Pawn:
     """
@@ -10,40 +13,75 @@ class Pawn:
     - position (tuple): The current position of the pawn.
     - goal (tuple): The goal position of the pawn.
     - maze (Maze): The maze object representing the maze.
-    - __path (list): The path of the pawn as a list of indices.
-    - move_history (list): The history of the pawn's moves as a list of positions.
+    - __path (numpy.ndarray): The path of the pawn as an int32 array of indices, or None.
+    - __pathCursor (int): The position of the pawn on its path.
+    - move_history (MoveHistory): The history of the pawn's moves, run-length compressed.
     - __pathFinder (PathFinder): The path finder object used to find the shortest path.
+    - __incrementalPathFinder (IncrementalPathFinder): The incremental path finder, if the pawn uses one.
+    - __distanceField (DistanceField): The distance field to the goal, if the pawn uses one.
 
     Methods:
-    - __init__(startPosition, goal, maze): Initializes the Pawn object.
+    - __init__(startPosition, goal, maze, planner, distanceField, historyCapacity): Initializes the Pawn object.
     - setGoal(goal): Sets the goal position of the pawn.
     - getGoal(): Returns the goal position of the pawn.
     - setPath(path): Sets the path of the pawn.
-    - getPath(): Returns the path of the pawn.
+    - getPath(): Returns the remaining path of the pawn.
+    - isOnPath(wall): Checks if a wall lies across the remaining path of the pawn.
+    - canShortcut(wall): Checks if removing a wall can shorten the remaining path of the pawn.
     - setMaze(maze): Sets the maze object for the pawn.
+    - notifyWallChange(wall): Informs the pawn that a wall of its maze was added or removed.
+    - notifyWallChanges(removed, added): Informs the pawn that several walls of its maze were added or removed.
     - move(): Moves the pawn to the next position in the path.
-    - plot(): Plots the pawn's path on a graph.
-    - findPath(): Finds the shortest path from the start position to the goal position.
+    - plot(): Plots the pawn's path on a graph and keeps the artists to update them.
+    - findPath(graph): Finds the shortest path from the start position to the goal position.
     """
 
-    def __init__(self, startPosition : tuple, goal : tuple, maze : Maze):
+    PLANNERS = ('astar', 'incremental', 'field')
+
+    def __init__(self, startPosition : tuple, goal : tuple, maze : Maze, planner='astar', distanceField=None,
+                 historyCapacity=None):
         """
         Initialize the Pawn object.
 
         Parameters:
         - startPosition: The starting position of the pawn.
         - goal: The goal position of the pawn.
-        - maze: The maze object representing the maze.
+        - maze: The maze object representing the maze, for example a MazeView of
+          a live maze. The pawn only reads it.
+        - planner: 'astar' to solve from scratch on every search, 'incremental'
+          to keep the search state and repair it when walls change, or 'field'
+          to descend a distance field to the goal. Default is 'astar'.
+        - distanceField: A distance field to the goal shared with other pawns,
+          used by the 'field' planner. The owner of a shared field keeps it up
+          to date. If None, the pawn creates and updates its own field.
+        - historyCapacity: The maximum number of positions kept in the move
+          history. Default is None, which keeps all of them.
 
         Returns:
         None
         """
+        assert planner in Pawn.PLANNERS, f"The planner should be one of {Pawn.PLANNERS}."
         self.position = startPosition
         self.goal = goal
+        self.__incrementalPathFinder = None
+        self.__distanceField = None
+        self.__ownsDistanceField = False
+        self.__plotAxes = None
         self.setMaze(maze)
+        # Position of every vertex on the path, or -1.
+        self.__pathPositions = np.full(maze.getRows() * maze.getCols(), -1, dtype=np.int32)
+        self.__path = None
         self.setPath([])
-        self.move_history = [startPosition]
+        self.move_history = MoveHistory(startPosition, historyCapacity)
         self.__pathFinder = PathFinder(self.__maze.converToGraph(), self.position, self.goal)
+        if planner == 'incremental':
+            self.__incrementalPathFinder = IncrementalPathFinder(self.__maze, self.position, self.goal)
+        elif planner == 'field':
+            self.__ownsDistanceField = distanceField is None
+            if distanceField is None:
+                distanceField = DistanceField(self.__maze, self.goal)
+            assert distanceField.goal == self.goal, "The distance field should lead to the goal of the pawn."
+            self.__distanceField = distanceField
     
     def setGoal(self, goal):
         """
@@ -71,27 +109,121 @@ class Pawn:
     
     def setPath(self, path : list):
         """
-        Set the path of the pawn.
+        Set the path of the pawn. The pawn is at the start of the path.
 
         Parameters:
-        - path: The new path as a list of indices.
+        - path: The new path as a list or an array of indices, or None.
 
         Returns:
         None
         """
-        self.__path = path
+        # Index the position of every vertex on the path for isOnPath and canShortcut.
+        if self.__path is not None:
+            self.__pathPositions[self.__path] = -1
+        if path is None:
+            self.__path = None
+        else:
+            self.__path = np.asarray(path, dtype=np.int32)
+            self.__pathPositions[self.__path] = np.arange(len(self.__path), dtype=np.int32)
+        self.__pathCursor = 0
     
     def getPath(self):
         """
-        Get the path of the pawn.
+        Get the remaining path of the pawn, from its position to the goal.
+
+        Parameters:
+        None
+
+        Returns:
+        The path as an int32 array of indices, which is a view that must not be changed, or None.
+        """
+        if self.__path is None:
+            return None
+        return self.__path[self.__pathCursor:]
+
+    def __hasPath(self):
+        """
+        Check if the pawn has a remaining path.
 
         Parameters:
         None
 
         Returns:
-        The path as a list of indices.
+        True if the remaining path is not empty, False otherwise.
+        """
+        return self.__path is not None and self.__pathCursor < len(self.__path)
+
+    def __findPathPosition(self, v):
+        """
+        Find how many steps ahead of the pawn a vertex is on its remaining path.
+
+        Parameters:
+        - v: The vertex.
+
+        Returns:
+        The number of steps, or -1 if the vertex is not on the remaining path.
+        """
+        index = self.__maze.findIndexOfVertex(v)
+        if index < 0:
+            return -1
+        position = int(self.__pathPositions[index])
+        if position < self.__pathCursor:
+            return -1
+        return position - self.__pathCursor
+
+    def isOnPath(self, wall):
+        """
+        Check if a wall lies across the remaining path of the pawn. A wall that
+        does not cannot invalidate the path, so adding it needs no replanning.
+
+        Parameters:
+        - wall: The wall to check.
+
+        Returns:
+        True if the wall blocks a step of the path or the pawn has no path, False otherwise.
+        """
+        if not self.__hasPath():
+            return True
+        startPosition = self.__findPathPosition(wall[0])
+        endPosition = self.__findPathPosition(wall[1])
+        return startPosition >= 0 and endPosition >= 0 and abs(startPosition - endPosition) == 1
+
+    def canShortcut(self, wall):
+        """
+        Check if removing a wall can shorten the remaining path of the pawn.
+
+        A path through the opened passage is at least as long as the distance
+        from the pawn to one end, plus one step, plus the distance from the other
+        end to the goal. The remaining path is a shortest path, so these
+        distances are exact for vertices on it; for other vertices the Manhattan
+        distance is used as a lower bound. If neither direction is shorter than
+        the remaining path, the removal cannot change it.
+
+        Parameters:
+        - wall: The removed wall.
+
+        Returns:
+        True if the path may get shorter or the pawn has no path, False otherwise.
         """
-        return self.__path
+        if not self.__hasPath():
+            return True
+        length = len(self.__path) - 1 - self.__pathCursor
+
+        def distanceFromPawn(v):
+            position = self.__findPathPosition(v)
+            if position >= 0:
+                return position
+            return abs(v[0] - self.position[0]) + abs(v[1] - self.position[1])
+
+        def distanceToGoal(v):
+            position = self.__findPathPosition(v)
+            if position >= 0:
+                return length - position
+            return abs(v[0] - self.goal[0]) + abs(v[1] - self.goal[1])
+
+        (start, end) = wall
+        return (distanceFromPawn(start) + 1 + distanceToGoal(end) < length or
+                distanceFromPawn(end) + 1 + distanceToGoal(start) < length)
     
     def setMaze(self, maze : Maze):
         """
@@ -104,10 +236,52 @@ class Pawn:
         None
         """
         self.__maze = maze
+        if self.__incrementalPathFinder is not None:
+            self.__incrementalPathFinder.setMaze(maze)
+        if self.__ownsDistanceField and maze.walls is not self.__distanceField.maze.walls:
+            self.__distanceField = DistanceField(maze, self.goal)
+
+    def notifyWallChange(self, wall):
+        """
+        Inform the pawn that a wall of its maze was added or removed, so an
+        incremental planner or an owned distance field can update only the
+        affected part of its search.
+
+        Parameters:
+        - wall: The wall that changed.
+
+        Returns:
+        None
+        """
+        if self.__incrementalPathFinder is not None:
+            self.__incrementalPathFinder.notifyWallChange(wall)
+        if self.__ownsDistanceField:
+            self.__distanceField.notifyWallChange(wall)
+
+    def notifyWallChanges(self, removed, added):
+        """
+        Inform the pawn that several walls of its maze were added or removed
+        at once. The maze already shows all of the changes.
+
+        Parameters:
+        - removed: The walls that were removed.
+        - added: The walls that were added.
+
+        Returns:
+        None
+        """
+        if self.__incrementalPathFinder is not None:
+            for wall in removed:
+                self.__incrementalPathFinder.notifyWallChange(wall)
+            for wall in added:
+                self.__incrementalPathFinder.notifyWallChange(wall)
+        if self.__ownsDistanceField:
+            self.__distanceField.notifyWallChanges(removed, added)
     
     def move(self):
         """
-        Move the pawn to the next position in the path.
+        Move the pawn to the next position in the path. The path is not
+        copied, only its cursor advances, so a move is O(1).
 
         Parameters:
         None
@@ -115,19 +289,20 @@ class Pawn:
         Returns:
         None
         """
-        if self.position != self.goal and len(self.__path) > 0:
-            nextIndex = self.__path[self.__path.index(self.__maze.findIndexOfVertex(self.position)) + 1]
-            self.position = self.__maze.vertices[nextIndex]
-
-            # Remove the previous position from the path
-            self.__path = self.__path[1:]
+        if self.position != self.goal and self.__path is not None and self.__pathCursor + 1 < len(self.__path):
+            self.__pathCursor += 1
+            self.position = self.__maze.vertices[int(self.__path[self.__pathCursor])]
 
             # Add the current position to the move history.
             self.move_history.append(self.position)
 
     def plot(self):
         """
-        Plot the pawn's path on a graph.
+        Plot the pawn's path on a graph. The artists are kept, so plotting again
+        on the same axes only updates their data. The line of the move history
+        is extended by the moves since the last plot, and loses the positions
+        the history dropped since then, so it is not rebuilt from the whole
+        history every frame.
 
         Parameters:
         None
@@ -135,49 +310,82 @@ class Pawn:
         Returns:
         None
         """
-        # Plot the path if available.
-        if self.__path:
-            pathCoords = [self.__maze.vertices[i] for i in self.__path]
-            path_x = [coord[0] for coord in pathCoords]
-            path_y = [coord[1] for coord in pathCoords]
-            plt.plot(path_x, path_y, 'b', linewidth=2)
-
-        # Plot the move history if available.
-        if self.move_history:
-            move_x = [coord[0] for coord in self.move_history]
-            move_y = [coord[1] for coord in self.move_history]
-            plt.plot(move_x, move_y, 'lightblue', linewidth=1)
-
-            # Plot start flag.
-            plt.plot(move_x[0], move_y[0], 'o', color='lightblue', markersize=8)
-
-        # Plot start marker.
-        plt.plot(self.position[0], self.position[1], 'go', markersize=10)
-
-        # Plot finish flag.
-        flag_x = self.goal[0] + 0.17
-        flag_y = self.goal[1] + 0.73
-        plt.plot(flag_x, flag_y, marker='>', color='r', markersize=12)
-        
-        # Plot flagpole.
-        plt.plot([self.goal[0], self.goal[0]], [self.goal[1] + 0.5, self.goal[1] ], color='black', linewidth=3)
-        
-        # Plot flagpole base.
-        plt.plot([self.goal[0] - 0.1, self.goal[0] + 0.1], [self.goal[1], self.goal[1]], color='black', linewidth=3)
-        
-    
-    def findPath(self):
+        import matplotlib.pyplot as plt
+
+        axes = plt.gca()
+        if self.__plotAxes is not axes:
+            self.__plotAxes = axes
+            # Path, move history, start flag and pawn marker.
+            self.__pathLine, = axes.plot([], [], 'b', linewidth=2)
+            self.__historyLine, = axes.plot([], [], 'lightblue', linewidth=1)
+            self.__startMarker, = axes.plot([], [], 'o', color='lightblue', markersize=8)
+            self.__positionMarker, = axes.plot([], [], 'go', markersize=10)
+
+            # Plot finish flag.
+            flag_x = self.goal[0] + 0.17
+            flag_y = self.goal[1] + 0.73
+            axes.plot(flag_x, flag_y, marker='>', color='r', markersize=12)
+
+            # Plot flagpole.
+            axes.plot([self.goal[0], self.goal[0]], [self.goal[1] + 0.5, self.goal[1] ], color='black', linewidth=3)
+
+            # Plot flagpole base.
+            axes.plot([self.goal[0] - 0.1, self.goal[0] + 0.1], [self.goal[1], self.goal[1]], color='black', linewidth=3)
+
+            # The plotted move history and the number of moves it covers.
+            self.__historyX = [coord[0] for coord in self.move_history]
+            self.__historyY = [coord[1] for coord in self.move_history]
+            self.__plottedMoves = self.move_history.totalMoves
+            self.__historyLine.set_data(self.__historyX, self.__historyY)
+            self.__startMarker.set_data(self.__historyX[:1], self.__historyY[:1])
+
+        # Update the path if available.
+        path = self.getPath()
+        if path is None:
+            path = np.zeros(0, dtype=np.int32)
+        cols = self.__maze.getCols()
+        self.__pathLine.set_data(path // cols, path % cols)
+
+        # Append the moves since the last plot and drop the positions the history dropped.
+        newMoves = self.move_history.totalMoves - self.__plottedMoves
+        if newMoves > 0:
+            for x, y in self.move_history.tail(newMoves):
+                self.__historyX.append(x)
+                self.__historyY.append(y)
+            dropped = len(self.__historyX) - len(self.move_history)
+            if dropped > 0:
+                del self.__historyX[:dropped]
+                del self.__historyY[:dropped]
+            self.__plottedMoves = self.move_history.totalMoves
+            self.__historyLine.set_data(self.__historyX, self.__historyY)
+            self.__startMarker.set_data(self.__historyX[:1], self.__historyY[:1])
+
+        # Update the pawn marker.
+        self.__positionMarker.set_data([self.position[0]], [self.position[1]])
+
+    def findPath(self, graph=None):
         """
         Find the shortest path from the start position to the goal position.
 
         Parameters:
-        None
+        - graph: The graph of the maze of the pawn, shared by pawns that replan
+          together. Default is None, which converts the maze to a graph.
 
         Returns:
         The shortest path as a list of indices, or None if no valid path is found.
         """
+        # Repair the search of the incremental planner if the pawn uses one.
+        if self.__incrementalPathFinder is not None:
+            self.__incrementalPathFinder.setStart(self.position)
+            self.__incrementalPathFinder.computeShortestPath()
+            return self.__incrementalPathFinder.getPath()
+
+        # Descend the distance field if the pawn uses one.
+        if self.__distanceField is not None:
+            return self.__distanceField.getPath(self.position)
+
         # Set the graph, start position, and goal position for the path finder.
-        self.__pathFinder.setGraph(self.__maze.converToGraph())
+        self.__pathFinder.setGraph(graph if graph is not None else self.__maze.converToGraph())
         self.__pathFinder.setStart(self.position)
         self.__pathFinder.setGoal(self.goal)
         
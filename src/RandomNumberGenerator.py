@@ -4,22 +4,32 @@ class RandomNumberGenerator:
     """
     A class that implements a random number generator using the LCG2 algorithm.
 
+    The parameters are validated once when they are set, so drawing a number
+    checks nothing but the limit. Blocks of numbers are computed with NumPy by jumping
+    ahead, and give exactly the same sequence as repeated calls of generate().
+    A generator can be limited to a number of values, so that a stream which
+    is part of a longer sequence cannot run into the values after it.
+
     Attributes:
         modulus (int): The modulus value for the LCG2 algorithm.
         multiplier (int): The multiplier value for the LCG2 algorithm.
         increment (int): The increment value for the LCG2 algorithm.
         startingVal (int): The starting value for the LCG2 algorithm.
+        limit (int): The number of values that can still be drawn, or None for no limit.
 
     Methods:
         setModulus(modulus): Setter method for the modulus attribute.
         setMultiplier(multiplier): Setter method for the multiplier attribute.
         setIncrement(increment): Setter method for the increment attribute.
         setStartingVal(startingVal): Setter method for the startingVal attribute.
+        setLimit(limit): Setter method for the limit attribute.
         generate(): Generates a random number using the LCG2 algorithm.
+        jumpAhead(steps): Skips the given number of values in O(log steps).
+        generateBlock(n): Generates the next n random numbers as a NumPy array.
 
     """
 
-    def __init__(self, modulus=2**31-1, multiplier=16807, increment=0, startingVal=None):
+    def __init__(self, modulus=2**31-1, multiplier=16807, increment=0, startingVal=None, limit=None):
         """
         Initializes a RandomNumberGenerator object.
 
@@ -28,12 +38,14 @@ class RandomNumberGenerator:
             multiplier (int): The multiplier value for the LCG2 algorithm. Default is 16807.
             increment (int): The increment value for the LCG2 algorithm. Default is 0.
             startingVal (int): The starting value for the LCG2 algorithm. If None, a random starting value is generated.
+            limit (int): The number of values that can be drawn. Default is None, which means no limit.
 
         """
         self.setModulus(modulus)
         self.setMultiplier(multiplier)
         self.setIncrement(increment)
         self.setStartingVal(startingVal)
+        self.setLimit(limit)
 
     def setModulus(self, modulus):
         """
@@ -43,6 +55,8 @@ class RandomNumberGenerator:
             modulus (int): The modulus value for the LCG2 algorithm.
 
         """
+        assert (type(modulus) == int)
+        assert (modulus >= 1), "Modulus should be greater than or equal to 1. (1 ≤ m)"
         self.__modulus = modulus
 
     def setMultiplier(self, multiplier):
@@ -53,6 +67,10 @@ class RandomNumberGenerator:
             multiplier (int): The multiplier value for the LCG2 algorithm.
 
         """
+        assert (type(multiplier) == int)
+        assert (multiplier >= 0 and multiplier <= self.__modulus - 1), "Multiplier should be greater or equal\
+    to 0 and should be smaller than or equal to modulus - 1. (0 ≤ a ≤ m − 1)"
+        assert ((self.__modulus % multiplier) <= (self.__modulus // multiplier)), "(m mod a) ≤ floor(m / a)"
         self.__multiplier = multiplier
 
     def setIncrement(self, increment):
@@ -63,6 +81,9 @@ class RandomNumberGenerator:
             increment (int): The increment value for the LCG2 algorithm.
 
         """
+        assert (type(increment) == int)
+        assert (increment >= 0 and increment <= self.__modulus - 1), "Incrementshould be greater or equal to\
+    0 and should be smaller than or equal to modulus - 1. (0 ≤ c ≤ m − 1)"
         self.__increment = increment
 
     def setStartingVal(self, startingVal):
@@ -75,11 +96,43 @@ class RandomNumberGenerator:
         """
         if startingVal is None:
             startingVal = np.random.randint(0, self.__modulus)
+        startingVal = int(startingVal)
+        assert (startingVal >= 0 and startingVal <= self.__modulus - 1), "Starting should be greater or equal\
+    to 0 and should be smaller than or equal to modulus - 1. (0 ≤ X0 ≤ m − 1)"
         self.__startingVal = startingVal
 
+    def setLimit(self, limit):
+        """
+        Setter method for the limit attribute.
+
+        Args:
+            limit (int): The number of values that can still be drawn, or None for no limit.
+
+        """
+        assert (limit is None or limit >= 0), "The limit should be non-negative."
+        self.__limit = limit
+
+    def __draw(self, n):
+        """
+        Helper method to take n values from the limit before they are drawn.
+
+        Args:
+            n (int): The number of values.
+
+        Raises:
+            RuntimeError: If fewer than n values are left.
+
+        """
+        if self.__limit is not None:
+            if n > self.__limit:
+                raise RuntimeError(f"The random number stream is exhausted: {n} values were requested, "
+                                   f"but only {self.__limit} are left.")
+            self.__limit -= n
+
     def __moduloSum(self, x, y, m):
         """
         Helper method to calculate the modulo sum of two numbers.
+        The caller guarantees 0 ≤ x, y ≤ m − 1.
 
         Args:
             x (int): The first number.
@@ -90,12 +143,6 @@ class RandomNumberGenerator:
             int: The modulo sum of x and y.
 
         """
-        assert (x >= 0 and y >= 0), "0 ≤ x, y"
-        assert (x <= m-1 and y <= m-1), "x, y ≤ m − 1"
-        assert (type(x)==int)
-        assert (type(y)==int)
-        assert (type(m)==int)
-
         if (x <= m - 1 - y):
             return x + y
         else:
@@ -108,23 +155,98 @@ class RandomNumberGenerator:
         Returns:
             int: The generated random number.
 
+        Raises:
+            RuntimeError: If the limit of the generator is reached.
+
         """
-        # Check inputs if they are valid.
-        assert (self.__modulus >= 1), "Modulus should be greater than or equal to 1. (1 ≤ m)"
-        assert (self.__multiplier >= 0 and self.__multiplier <= self.__modulus - 1), "Multiplier should be greater or equal\
-    to 0 and should be smaller than or equal to modulus - 1. (0 ≤ a ≤ m − 1)"
-        assert (self.__increment >= 0 and self.__increment <= self.__modulus - 1), "Incrementshould be greater or equal to\
-    0 and should be smaller than or equal to modulus - 1. (0 ≤ c ≤ m − 1)"
-        assert (self.__startingVal >= 0 and self.__startingVal <= self.__modulus - 1), "Starting should be greater or equal\
-    to 0 and should be smaller than or equal to modulus - 1. (0 ≤ X0 ≤ m − 1)"
-        assert ((self.__modulus % self.__multiplier) <= np.floor(self.__modulus / self.__multiplier)), "(m mod a) ≤ floor(m / a)"
+        self.__draw(1)
+        return self.__next()
+
+    def __next(self):
+        """
+        Helper method to advance the LCG2 algorithm by one step.
+
+        Returns:
+            int: The next random number.
 
-        # LCG2 algorithm.
+        """
+        # LCG2 algorithm. The inputs were validated by the setters.
         q = self.__modulus // self.__multiplier
         p = self.__modulus % self.__multiplier
         r = self.__multiplier * (self.__startingVal % q) - p * (self.__startingVal // q)
         if r < 0:
             r = r + self.__modulus
         r = self.__moduloSum(r, self.__increment, self.__modulus)
-        self.setStartingVal(r)
+        self.__startingVal = r
         return r
+
+    def __affinePower(self, steps):
+        """
+        Computes the map of the given number of LCG2 steps, x -> (A * x + C) mod m,
+        by repeated squaring.
+
+        Args:
+            steps (int): The number of steps.
+
+        Returns:
+            tuple: The multiplier A and the increment C of the combined map.
+
+        """
+        m = self.__modulus
+        # (A, C) of the result, and (a, c) of the current power of two steps.
+        A, C = 1 % m, 0
+        a, c = self.__multiplier, self.__increment
+        while steps > 0:
+            if steps & 1:
+                A, C = (a * A) % m, (a * C + c) % m
+            a, c = (a * a) % m, (a * c + c) % m
+            steps >>= 1
+        return A, C
+
+    def jumpAhead(self, steps):
+        """
+        Skips the given number of values in O(log steps), as if generate() had been called that many times.
+
+        Args:
+            steps (int): The number of values to skip.
+
+        Raises:
+            RuntimeError: If fewer than steps values are left before the limit of the generator.
+
+        """
+        assert (steps >= 0), "The number of steps should be non-negative."
+        self.__draw(steps)
+        A, C = self.__affinePower(steps)
+        self.__startingVal = (A * self.__startingVal + C) % self.__modulus
+
+    def generateBlock(self, n):
+        """
+        Generates the next n random numbers. The block is built in O(log n)
+        vectorized steps: the first value is computed directly, and the block
+        is doubled by applying the jump-ahead map of its current length to it.
+
+        Args:
+            n (int): The number of random numbers.
+
+        Returns:
+            numpy.ndarray: The int64 array of the next n numbers, identical to n calls of generate().
+
+        Raises:
+            RuntimeError: If fewer than n values are left before the limit of the generator.
+
+        """
+        assert (n >= 0), "The block size should be non-negative."
+        self.__draw(n)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        m = self.__modulus
+        # A * x + C must fit into int64 for the vectorized steps.
+        if (m - 1) * (m - 1) + (m - 1) >= 2**63:
+            return np.array([self.__next() for _ in range(n)], dtype=object)
+
+        block = np.array([self.__next()], dtype=np.int64)
+        while len(block) < n:
+            A, C = self.__affinePower(len(block))
+            block = np.concatenate((block, (A * block[:n - len(block)] + C) % m))
+        self.__startingVal = int(block[-1])
+        return block
@@ -0,0 +1,293 @@
+import numpy as np
+import time
+from Stats import Stats
+
+class RasterRenderer:
+    """
+    This class draws a dynamic maze offscreen into a NumPy RGB buffer.
+
+    Every cell of the maze is a square block of cellSize pixels. The x axis
+    of the maze runs to the right and the y axis upwards, as in the plots.
+    The buffer is reused between frames, so a copy has to be made if a frame
+    is kept. Consecutive ticks of the same maze are drawn from its change
+    set, by redrawing only the blocks of the dirty cells. Every pawn has its
+    own trails, and a cell shows the trails of all pawns that pass it.
+
+    Attributes:
+        rows (int): The number of rows in the maze.
+        cols (int): The number of columns in the maze.
+        cellSize (int): The size of a cell in pixels.
+        wallWidth (int): The width of a wall in pixels.
+        frame (numpy.ndarray): The RGB buffer of shape (cols * cellSize, rows * cellSize, 3).
+
+    Methods:
+        __init__(self, rows, cols, cellSize=8, wallWidth=2): Initializes a RasterRenderer object.
+        render(self, dynamicMaze): Draws the maze and its pawns into the buffer, redrawing only the changed cells if it can.
+    """
+
+    BACKGROUND = (255, 255, 255)
+    WALL = (128, 128, 128)
+    PATH = (0, 0, 255)
+    HISTORY = (173, 216, 230)
+    PAWN = (0, 128, 0)
+    GOAL = (255, 0, 0)
+
+    def __init__(self, rows, cols, cellSize=8, wallWidth=2):
+        """
+        Initializes a RasterRenderer object.
+
+        Args:
+            rows (int): The number of rows in the maze.
+            cols (int): The number of columns in the maze.
+            cellSize (int): The size of a cell in pixels. Default is 8.
+            wallWidth (int): The width of a wall in pixels. Default is 2.
+        """
+        assert cellSize >= 4, "The cell size should be at least 4 pixels."
+        self.rows = rows
+        self.cols = cols
+        self.cellSize = cellSize
+        self.wallWidth = max(1, min(wallWidth, cellSize // 2))
+        self.frame = np.zeros((cols * cellSize, rows * cellSize, 3), dtype=np.uint8)
+        # The maze and the tick the buffer shows, and the trails drawn in it, one entry per pawn.
+        self.__renderedMaze = None
+        self.__renderedTick = None
+        self.__historyCells = []
+        self.__historyLinks = []
+        self.__pathLinks = []
+        self.__goalCells = []
+        self.__pawnCells = []
+
+    def __blocks(self):
+        """
+        Returns a view of the buffer with one block per cell, indexed as
+        [cols - 1 - y, pixel row, x, pixel column, channel].
+
+        Returns:
+            numpy.ndarray: The view of the buffer.
+        """
+        cellSize = self.cellSize
+        return self.frame.reshape(self.cols, cellSize, self.rows, cellSize, 3)
+
+    def __drawWalls(self, north, east):
+        """
+        Draws the walls. A wall is split between the two cells it separates.
+
+        Args:
+            north (numpy.ndarray): The north wall grid.
+            east (numpy.ndarray): The east wall grid.
+        """
+        blocks = self.__blocks()
+        half = max(1, self.wallWidth // 2)
+        wall = np.array(RasterRenderer.WALL, dtype=np.uint8)
+        # Wall grids in the block order, y flipped and first.
+        north = np.asarray(north).T[::-1]
+        east = np.asarray(east).T[::-1]
+
+        # The north wall of (x, y) lies on the top of (x, y) and on the bottom of (x, y + 1).
+        np.copyto(blocks[:, :half], wall, where=north[:, None, :, None, None])
+        np.copyto(blocks[:-1, -half:], wall, where=north[1:, None, :, None, None])
+        # The east wall of (x, y) lies on the right of (x, y) and on the left of (x + 1, y).
+        np.copyto(blocks[:, :, :, -half:], wall, where=east[:, None, :, None, None])
+        np.copyto(blocks[:, :, 1:, :half], wall, where=east[:, None, :-1, None, None])
+
+    def __link(self, links, indexOf_a, indexOf_b):
+        """
+        Adds a step between two cells to a trail. A trail can pass the same
+        step more than once, so the steps are counted.
+
+        Args:
+            links (dict): The trail, mapping a cell to the number of steps to every cell it is linked to.
+            indexOf_a (int): The index of one cell.
+            indexOf_b (int): The index of the other cell.
+        """
+        for indexOf_v, indexOf_u in ((indexOf_a, indexOf_b), (indexOf_b, indexOf_a)):
+            linked = links.setdefault(indexOf_v, {})
+            linked[indexOf_u] = linked.get(indexOf_u, 0) + 1
+
+    def __unlink(self, links, indexOf_a, indexOf_b):
+        """
+        Removes a step between two cells from a trail. The cells stay linked
+        while the trail passes the step another time.
+
+        Args:
+            links (dict): The trail, mapping a cell to the number of steps to every cell it is linked to.
+            indexOf_a (int): The index of one cell.
+            indexOf_b (int): The index of the other cell.
+        """
+        for indexOf_v, indexOf_u in ((indexOf_a, indexOf_b), (indexOf_b, indexOf_a)):
+            linked = links.get(indexOf_v)
+            if linked is not None and indexOf_u in linked:
+                linked[indexOf_u] -= 1
+                if linked[indexOf_u] == 0:
+                    del linked[indexOf_u]
+                if not linked:
+                    del links[indexOf_v]
+
+    def __drawTrailCell(self, block, index, links, color, margin):
+        """
+        Draws the part of a trail inside the block of a cell: the middle of the
+        cell and a connector towards every cell it is linked to. The other half
+        of a connector lies in the block of the linked cell.
+
+        Args:
+            block (numpy.ndarray): The block of the cell.
+            index (int): The index of the cell.
+            links (iterable): The indices of the cells it is linked to.
+            color (tuple): The RGB color.
+            margin (int): The number of pixels left free on every side of the middle.
+        """
+        cellSize, cols = self.cellSize, self.cols
+        inner = slice(margin, cellSize - margin)
+        block[inner, inner] = color
+        for linked in links:
+            if linked == index + cols:
+                block[inner, cellSize - margin:] = color
+            elif linked == index - cols:
+                block[inner, :margin] = color
+            elif linked == index + 1:
+                block[:margin, inner] = color
+            else:
+                block[cellSize - margin:, inner] = color
+
+    def __drawOverlays(self, index):
+        """
+        Draws the move histories, the paths, the goals and the pawns inside the block of a cell.
+
+        Args:
+            index (int): The index of the cell.
+        """
+        x, y = divmod(index, self.cols)
+        block = self.__blocks()[self.cols - 1 - y, :, x]
+        margin = max(self.wallWidth, self.cellSize * 3 // 8)
+        for historyCells, historyLinks in zip(self.__historyCells, self.__historyLinks):
+            if index in historyCells:
+                self.__drawTrailCell(block, index, historyLinks.get(index, ()), RasterRenderer.HISTORY, margin)
+        for pathLinks in self.__pathLinks:
+            if index in pathLinks:
+                self.__drawTrailCell(block, index, pathLinks[index], RasterRenderer.PATH, margin)
+        markerMargin = self.wallWidth
+        marker = slice(markerMargin, self.cellSize - markerMargin)
+        if index in self.__goalCells:
+            block[marker, marker] = RasterRenderer.GOAL
+        if index in self.__pawnCells:
+            block[marker, marker] = RasterRenderer.PAWN
+
+    def __drawCell(self, index, north, east):
+        """
+        Draws a cell from scratch: the background, the halves of its four walls
+        that lie inside its block, and the overlays.
+
+        Args:
+            index (int): The index of the cell.
+            north (numpy.ndarray): The north wall grid.
+            east (numpy.ndarray): The east wall grid.
+        """
+        x, y = divmod(index, self.cols)
+        block = self.__blocks()[self.cols - 1 - y, :, x]
+        half = max(1, self.wallWidth // 2)
+        block[:] = RasterRenderer.BACKGROUND
+        if north[x, y]:
+            block[:half] = RasterRenderer.WALL
+        if y > 0 and north[x, y - 1]:
+            block[-half:] = RasterRenderer.WALL
+        if east[x, y]:
+            block[:, -half:] = RasterRenderer.WALL
+        if x > 0 and east[x - 1, y]:
+            block[:, :half] = RasterRenderer.WALL
+        self.__drawOverlays(index)
+
+    def __renderFull(self, dynamicMaze):
+        """
+        Rebuilds the trails from the pawns and draws the whole maze.
+
+        Args:
+            dynamicMaze (DynamicMaze): The maze with its pawns.
+        """
+        cols = self.cols
+        self.__historyCells = []
+        self.__historyLinks = []
+        self.__pathLinks = []
+        for pawn in dynamicMaze.pawns:
+            history = [x * cols + y for (x, y) in pawn.move_history]
+            historyCells = {}
+            for index in history:
+                historyCells[index] = historyCells.get(index, 0) + 1
+            historyLinks = {}
+            for a, b in zip(history, history[1:]):
+                if a != b:
+                    self.__link(historyLinks, a, b)
+            path = pawn.getPath()
+            path = path.tolist() if path is not None else []
+            pathLinks = {}
+            for a, b in zip(path, path[1:]):
+                self.__link(pathLinks, a, b)
+            self.__historyCells.append(historyCells)
+            self.__historyLinks.append(historyLinks)
+            self.__pathLinks.append(pathLinks)
+        self.__goalCells = [pawn.goal[0] * cols + pawn.goal[1] for pawn in dynamicMaze.pawns]
+        self.__pawnCells = [pawn.position[0] * cols + pawn.position[1] for pawn in dynamicMaze.pawns]
+
+        self.frame[:] = RasterRenderer.BACKGROUND
+        self.__drawWalls(dynamicMaze.walls.north, dynamicMaze.walls.east)
+        cells = set(self.__goalCells) | set(self.__pawnCells)
+        cells = cells.union(*self.__historyCells, *self.__pathLinks)
+        for index in cells:
+            self.__drawOverlays(index)
+
+    def __renderChanges(self, dynamicMaze, changeSet):
+        """
+        Applies the changes of a tick to the trails and redraws only the cells
+        whose drawing changed.
+
+        Args:
+            dynamicMaze (DynamicMaze): The maze with its pawns.
+            changeSet (ChangeSet): The changes since the last rendered tick.
+        """
+        for pawn, oldIndex, newIndex in changeSet.pawnMoves:
+            historyCells = self.__historyCells[pawn]
+            historyCells[newIndex] = historyCells.get(newIndex, 0) + 1
+            self.__link(self.__historyLinks[pawn], oldIndex, newIndex)
+            self.__pawnCells[pawn] = newIndex
+        for pawn, droppedIndex, nextIndex in changeSet.historyDrops:
+            historyCells = self.__historyCells[pawn]
+            historyCells[droppedIndex] -= 1
+            if historyCells[droppedIndex] == 0:
+                del historyCells[droppedIndex]
+            self.__unlink(self.__historyLinks[pawn], droppedIndex, nextIndex)
+        for pawn, indexOf_a, indexOf_b in changeSet.removedPathSteps:
+            self.__unlink(self.__pathLinks[pawn], indexOf_a, indexOf_b)
+        for pawn, indexOf_a, indexOf_b in changeSet.addedPathSteps:
+            self.__link(self.__pathLinks[pawn], indexOf_a, indexOf_b)
+
+        north, east = dynamicMaze.walls.north, dynamicMaze.walls.east
+        for index in changeSet.dirtyCells(self.cols):
+            self.__drawCell(index, north, east)
+
+    def render(self, dynamicMaze):
+        """
+        Draws the maze, the move histories, the paths and the pawns into the
+        buffer. If the last rendered tick of the same maze is the one before the
+        current tick and no pawn was added since, only the cells in the change
+        set of the maze are redrawn, so the cost follows the number of changes
+        and not the size of the maze. Otherwise the whole maze is drawn.
+
+        Args:
+            dynamicMaze (DynamicMaze): The maze with its pawns.
+
+        Returns:
+            numpy.ndarray: The RGB buffer.
+        """
+        stats = Stats.active
+        if stats is not None:
+            startTime = time.perf_counter()
+        changeSet = dynamicMaze.changeSet
+        if (dynamicMaze is self.__renderedMaze and changeSet.tick == self.__renderedTick + 1 and
+                len(dynamicMaze.pawns) == len(self.__pawnCells)):
+            self.__renderChanges(dynamicMaze, changeSet)
+        else:
+            self.__renderFull(dynamicMaze)
+        self.__renderedMaze = dynamicMaze
+        self.__renderedTick = changeSet.tick
+        if stats is not None:
+            stats.addTime('render', time.perf_counter() - startTime)
+        return self.frame
@@ -0,0 +1,108 @@
+from RandomNumberGenerator import RandomNumberGenerator
+import numpy as np
+
+class SeedTree:
+    """
+    This class represents a node of a tree of random number streams.
+
+    All streams are parts of the single Park-Miller sequence that starts at
+    the state derived from the root seed. A node owns the values at positions
+    offset + 1 to offset + length of that sequence, and its children split
+    this range into parts, so the streams of different nodes never overlap.
+    The generator of a node is placed at the start of its range by jumping
+    ahead and is limited to its length, so a stream that runs out raises an
+    error instead of drawing the values of the next stream. A run is fully
+    defined by the root seed, no matter in which process or in which order
+    the streams are used.
+
+    Attributes:
+        seed (int): The root seed of the tree.
+        offset (int): The position in the sequence after which the stream of the node starts.
+        length (int): The number of values in the stream of the node.
+
+    Methods:
+        __init__(self, seed=None, offset=0, length=None): Initializes a SeedTree object.
+        part(self, start, length): Returns the part of the stream of the given length after the given position.
+        child(self, i, count): Returns the i-th of count equal parts of the stream.
+        split(self, count): Returns all count equal parts of the stream.
+        generator(self): Returns a random number generator placed at the start of the stream and limited to its length.
+    """
+
+    MODULUS = 2**31 - 1
+    MULTIPLIER = 16807
+
+    def __init__(self, seed=None, offset=0, length=None):
+        """
+        Initializes a SeedTree object.
+
+        Args:
+            seed (int): The root seed of the tree. If None, a random seed is chosen.
+            offset (int): The position in the sequence after which the stream starts. Default is 0.
+            length (int): The number of values in the stream. Default is None, which is the whole period.
+        """
+        if seed is None:
+            seed = np.random.randint(0, SeedTree.MODULUS)
+        if length is None:
+            length = SeedTree.MODULUS - 1 - offset
+        assert (seed >= 0), "The seed should be non-negative."
+        assert (offset >= 0 and length >= 0 and offset + length <= SeedTree.MODULUS - 1), "The stream should lie within one period."
+        self.seed = int(seed)
+        self.offset = offset
+        self.length = length
+
+    def part(self, start, length):
+        """
+        Returns the part of the stream of the given length after the given position.
+
+        Args:
+            start (int): The position in the stream after which the part starts.
+            length (int): The number of values in the part.
+
+        Returns:
+            SeedTree: The node of the part.
+        """
+        assert (start >= 0 and length >= 0 and start + length <= self.length), "The part should lie within the stream."
+        return SeedTree(self.seed, self.offset + start, length)
+
+    def child(self, i, count):
+        """
+        Returns the i-th of count equal parts of the stream.
+
+        Args:
+            i (int): The index of the part.
+            count (int): The number of parts.
+
+        Returns:
+            SeedTree: The node of the part.
+        """
+        assert (0 <= i < count), "The index of the part should be smaller than the number of parts."
+        length = self.length // count
+        return self.part(i * length, length)
+
+    def split(self, count):
+        """
+        Returns all count equal parts of the stream.
+
+        Args:
+            count (int): The number of parts.
+
+        Returns:
+            list: The nodes of the parts.
+        """
+        return [self.child(i, count) for i in range(count)]
+
+    def generator(self):
+        """
+        Returns a random number generator placed at the start of the stream and
+        limited to its length, so that it raises a RuntimeError instead of
+        drawing past the end of the stream.
+
+        Returns:
+            RandomNumberGenerator: The generator whose next value is the first value of the stream.
+        """
+        # The state of a multiplicative generator must not be 0.
+        randomNumberGenerator = RandomNumberGenerator(SeedTree.MODULUS, SeedTree.MULTIPLIER, 0,
+                                                      1 + self.seed % (SeedTree.MODULUS - 1))
+        randomNumberGenerator.jumpAhead(self.offset)
+        randomNumberGenerator.setLimit(self.length)
+        return randomNumberGenerator
@@ -0,0 +1,116 @@
+from DynamicMaze import DynamicMaze
+
+class Simulation:
+    """
+    A class that runs a dynamic maze without a display.
+
+    A tick updates the maze once and moves the pawns every cyclesPerMove
+    ticks, the same as the loop of main.py. Nothing is plotted, so
+    matplotlib is never imported.
+
+    Attributes:
+        dynamicMaze (DynamicMaze): The simulated maze with its pawns.
+        updateFactor (int): The number of walls to add or remove per tick.
+        cyclesPerMove (int): The number of ticks between two moves of the pawns.
+        maxTicks (int): The number of ticks after which the simulation stops, or None for no limit.
+        ticks (int): The number of ticks run so far.
+
+    Methods:
+        __init__(rows, cols, pawnSpeed, updateFactor, planner, generator, seed, updateMode, maxTicks, historyCapacity, pawns): Initializes the Simulation object.
+        reachedGoal(): Checks if every pawn is at its goal.
+        isFinished(): Checks if every pawn reached its goal or the tick limit is reached.
+        step(n): Runs up to n ticks.
+        runUntilGoal(maxTicks): Runs until every pawn reaches its goal or a tick limit is reached.
+    """
+
+    def __init__(self, rows=12, cols=12, pawnSpeed=0.33333, updateFactor=5, planner='astar', generator='prim',
+                 seed=None, updateMode='sequential', maxTicks=None, historyCapacity=None, pawns=1):
+        """
+        Initialize the Simulation object.
+
+        Parameters:
+        - rows: The number of rows in the maze. Default is 12.
+        - cols: The number of columns in the maze. Default is 12.
+        - pawnSpeed: The number of moves of the pawns per tick, between 0 and 1. Default is 0.33333.
+        - updateFactor: The number of walls to add or remove per tick. Default is 5.
+        - planner: The path planner of the pawns. Default is 'astar'.
+        - generator: The name of the maze generation algorithm. Default is 'prim'.
+        - seed: The root seed of the run, or a SeedTree node. If None, a random seed is chosen.
+        - updateMode: 'sequential' or 'batched'. Default is 'sequential'.
+        - maxTicks: The number of ticks after which the simulation stops. Default is None, which means no limit.
+        - historyCapacity: The maximum number of positions kept in the move history of a pawn.
+          Default is None, which keeps all of them.
+        - pawns: The number of pawns in the maze. Default is 1.
+
+        Returns:
+        None
+        """
+        self.dynamicMaze = DynamicMaze(rows, cols, planner, generator, seed, updateMode, historyCapacity, pawns)
+
+        # Normalize pawn speed to ensure it's between 0 and 1.
+        pawnSpeed = max(0.0000001, min(1, pawnSpeed))
+        # Normalize update factor to ensure it's greater than or equal to 0.
+        self.updateFactor = max(0, updateFactor)
+        # Calculate the number of cycles between each movement based on pawn speed.
+        self.cyclesPerMove = int(1 / pawnSpeed)
+
+        self.maxTicks = maxTicks
+        self.ticks = 0
+
+    def reachedGoal(self):
+        """
+        Check if every pawn is at its goal.
+
+        Returns:
+        True if all pawns reached their goals, False otherwise.
+        """
+        return all(pawn.position == pawn.goal for pawn in self.dynamicMaze.pawns)
+
+    def isFinished(self):
+        """
+        Check if every pawn reached its goal or the tick limit is reached.
+
+        Returns:
+        True if the simulation is over, False otherwise.
+        """
+        return self.reachedGoal() or (self.maxTicks is not None and self.ticks >= self.maxTicks)
+
+    def step(self, n=1):
+        """
+        Run up to n ticks. The simulation stops early when it is finished.
+
+        Parameters:
+        - n: The number of ticks to run. Default is 1.
+
+        Returns:
+        The number of ticks that were run.
+        """
+        dynamicMaze = self.dynamicMaze
+        for i in range(n):
+            if self.isFinished():
+                return i
+            dynamicMaze.updateMaze(self.updateFactor)
+            self.ticks += 1
+            if self.ticks % self.cyclesPerMove == 0:
+                dynamicMaze.movePawn()
+        return n
+
+    def runUntilGoal(self, maxTicks=None):
+        """
+        Run until every pawn reaches its goal or a tick limit is reached.
+
+        Parameters:
+        - maxTicks: The tick count at which to stop, in addition to the maxTicks
+          of the simulation. Default is None, which means no additional limit.
+
+        Returns:
+        True if all pawns reached their goals, False otherwise.
+        """
+        while not self.isFinished():
+            if maxTicks is None:
+                self.step(1024)
+            elif self.ticks < maxTicks:
+                self.step(min(1024, maxTicks - self.ticks))
+            else:
+                break
+        return self.reachedGoal()
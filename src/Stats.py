@@ -0,0 +1,121 @@
+import json
+
+class Stats:
+    """
+    This class collects per-phase timers and counters of a run.
+
+    Instrumentation is off by default. The instrumented code reads
+    Stats.active once and records only if it is not None, so a disabled run
+    pays a single attribute check per instrumented call and nothing in the
+    inner loops. Phases can be nested, for example the graph builds inside a
+    replan, so the times of different phases do not add up to the run time.
+
+    Attributes:
+        active (Stats): The Stats object that records, or None if instrumentation is off.
+        counters (dict): The value of every counter by name.
+        timers (dict): The total seconds and the number of calls of every phase by name.
+
+    Methods:
+        enable(): Starts recording into a new Stats object and returns it.
+        disable(): Stops recording and returns the Stats object that recorded.
+        __init__(self): Initializes a Stats object.
+        count(self, name, n=1): Adds to a counter.
+        addTime(self, name, seconds): Adds one call of a phase.
+        toDict(self): Returns the timers and counters as a dict.
+        dump(self, path): Writes the timers and counters to a JSON file.
+        report(self): Returns a per-phase breakdown as text.
+    """
+
+    active = None
+
+    @staticmethod
+    def enable():
+        """
+        Starts recording into a new Stats object.
+
+        Returns:
+            Stats: The Stats object that records.
+        """
+        Stats.active = Stats()
+        return Stats.active
+
+    @staticmethod
+    def disable():
+        """
+        Stops recording.
+
+        Returns:
+            Stats: The Stats object that recorded, or None if instrumentation was off.
+        """
+        stats, Stats.active = Stats.active, None
+        return stats
+
+    def __init__(self):
+        """
+        Initializes a Stats object.
+        """
+        self.counters = {}
+        self.timers = {}
+
+    def count(self, name, n=1):
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The name of the counter.
+            n (int): The amount to add. Default is 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def addTime(self, name, seconds):
+        """
+        Adds one call of a phase.
+
+        Args:
+            name (str): The name of the phase.
+            seconds (float): The time the call took in seconds.
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [seconds, 1]
+        else:
+            timer[0] += seconds
+            timer[1] += 1
+
+    def toDict(self):
+        """
+        Returns the timers and counters as a dict.
+
+        Returns:
+            dict: The phases with their total seconds and calls, and the counters.
+        """
+        return {
+            'timers': {name: {'seconds': seconds, 'calls': calls} for name, (seconds, calls) in self.timers.items()},
+            'counters': dict(self.counters),
+        }
+
+    def dump(self, path):
+        """
+        Writes the timers and counters to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, 'w') as file:
+            json.dump(self.toDict(), file, indent=2)
+
+    def report(self):
+        """
+        Returns a per-phase breakdown as text, with the slowest phase first.
+
+        Returns:
+            str: The breakdown of the timers followed by the counters.
+        """
+        lines = [f"{'phase':<16} {'calls':>10} {'total ms':>12} {'mean us':>10}"]
+        for name, (seconds, calls) in sorted(self.timers.items(), key=lambda item: -item[1][0]):
+            lines.append(f"{name:<16} {calls:>10} {seconds * 1e3:>12.3f} {seconds * 1e6 / calls:>10.2f}")
+        lines.append('')
+        lines.append(f"{'counter':<16} {'value':>10}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<16} {value:>10}")
+        return '\n'.join(lines)
@@ -0,0 +1,196 @@
+import numpy as np
+
+class WallGrid:
+    """
+    Stores the walls of a rectangular maze in two boolean grids.
+
+    A wall between (x, y) and (x, y + 1) is a north wall of (x, y), and a wall
+    between (x, y) and (x + 1, y) is an east wall of (x, y). The class behaves
+    like the list of ((x, y), (x, y)) tuples it replaces, so walls can still be
+    iterated, checked with `in`, appended and removed, but every lookup and
+    update is O(1) and does not depend on the orientation of the tuple.
+
+    Every change through the methods of the grid increments its version, so
+    anything derived from the walls, like the graph of a maze, can be cached
+    until the version changes. Code that writes into north or east directly
+    has to call markChanged afterwards.
+
+    Attributes:
+        north (numpy.ndarray): north[x, y] is True if there is a wall between (x, y) and (x, y + 1).
+        east (numpy.ndarray): east[x, y] is True if there is a wall between (x, y) and (x + 1, y).
+        version (int): The number of changes made to the grid.
+
+    Methods:
+        __init__(self, rows, cols, filled=False, north=None, east=None): Initializes a new instance of the WallGrid class.
+        getRows(self): Returns the number of rows of the grid.
+        getCols(self): Returns the number of columns of the grid.
+        fill(self): Puts a wall between every pair of neighboring vertices.
+        markChanged(self): Records a change made directly to the wall arrays.
+        copy(self): Creates an independent copy of the grid.
+        append(self, wall): Adds a wall to the grid.
+        remove(self, wall): Removes a wall from the grid.
+    """
+
+    def __init__(self, rows, cols, filled=False, north=None, east=None):
+        """
+        Initializes a new instance of the WallGrid class.
+
+        Args:
+            rows (int): The number of rows in the maze.
+            cols (int): The number of columns in the maze.
+            filled (bool): Whether to start with every possible wall in place. Default is False.
+            north (numpy.ndarray): An existing (rows, cols) boolean array to use for the north walls,
+                for example a memory-mapped one. Default is None, which allocates a new array.
+            east (numpy.ndarray): An existing (rows, cols) boolean array to use for the east walls.
+                Default is None, which allocates a new array.
+        """
+        self.__rows = rows
+        self.__cols = cols
+        self.north = np.zeros((rows, cols), dtype=bool) if north is None else north
+        self.east = np.zeros((rows, cols), dtype=bool) if east is None else east
+        self.version = 0
+        if filled:
+            self.fill()
+
+    def getRows(self):
+        """
+        Returns the number of rows of the grid.
+
+        Returns:
+            int: The number of rows of the grid.
+        """
+        return self.__rows
+
+    def getCols(self):
+        """
+        Returns the number of columns of the grid.
+
+        Returns:
+            int: The number of columns of the grid.
+        """
+        return self.__cols
+
+    def fill(self):
+        """
+        Puts a wall between every pair of neighboring vertices.
+        """
+        self.north[:, :self.__cols - 1] = True
+        self.east[:self.__rows - 1, :] = True
+        self.version += 1
+
+    def markChanged(self):
+        """
+        Records a change made directly to the wall arrays, so caches of the
+        walls are rebuilt.
+        """
+        self.version += 1
+
+    def copy(self):
+        """
+        Creates an independent copy of the grid.
+
+        Returns:
+            WallGrid: A copy of the grid.
+        """
+        copyGrid = WallGrid(self.__rows, self.__cols)
+        copyGrid.north[:] = self.north
+        copyGrid.east[:] = self.east
+        return copyGrid
+
+    def __locate(self, wall):
+        """
+        Finds the grid cell that stores a wall.
+
+        Args:
+            wall (tuple): The wall as a pair of vertices, in either order.
+
+        Returns:
+            tuple: The grid and the (x, y) cell of the wall, or None if the wall
+            does not separate two neighboring vertices of the maze.
+        """
+        try:
+            (x0, y0), (x1, y1) = wall
+        except (TypeError, ValueError):
+            return None
+        if x0 == x1 and abs(y1 - y0) == 1:
+            grid, x, y = self.north, x0, min(y0, y1)
+            valid = 0 <= x < self.__rows and 0 <= y < self.__cols - 1
+        elif y0 == y1 and abs(x1 - x0) == 1:
+            grid, x, y = self.east, min(x0, x1), y0
+            valid = 0 <= x < self.__rows - 1 and 0 <= y < self.__cols
+        else:
+            return None
+        if not valid:
+            return None
+        return grid, x, y
+
+    def __contains__(self, wall):
+        """
+        Checks if a wall is in the grid.
+
+        Args:
+            wall (tuple): The wall to check.
+
+        Returns:
+            bool: True if the wall exists, False otherwise.
+        """
+        location = self.__locate(wall)
+        if location is None:
+            return False
+        grid, x, y = location
+        return bool(grid[x, y])
+
+    def __iter__(self):
+        """
+        Iterates over the walls, north walls first and east walls second.
+
+        Yields:
+            tuple: The walls as ((x, y), (x, y)) tuples.
+        """
+        for x, y in np.argwhere(self.north).tolist():
+            yield ((x, y), (x, y + 1))
+        for x, y in np.argwhere(self.east).tolist():
+            yield ((x, y), (x + 1, y))
+
+    def __len__(self):
+        """
+        Returns the number of walls in the grid.
+
+        Returns:
+            int: The number of walls.
+        """
+        return int(np.count_nonzero(self.north) + np.count_nonzero(self.east))
+
+    def append(self, wall):
+        """
+        Adds a wall to the grid. Walls that are already in place are ignored.
+
+        Args:
+            wall (tuple): The wall to add.
+
+        Raises:
+            ValueError: If the wall does not separate two neighboring vertices of the maze.
+        """
+        location = self.__locate(wall)
+        if location is None:
+            raise ValueError(f"{wall} is not a wall of the maze.")
+        grid, x, y = location
+        grid[x, y] = True
+        self.version += 1
+
+    def remove(self, wall):
+        """
+        Removes a wall from the grid.
+
+        Args:
+            wall (tuple): The wall to remove.
+
+        Raises:
+            ValueError: If the wall is not in the grid.
+        """
+        location = self.__locate(wall)
+        if location is None or not location[0][location[1], location[2]]:
+            raise ValueError(f"{wall} is not in the maze.")
+        grid, x, y = location
+        grid[x, y] = False
+        self.version += 1
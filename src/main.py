@@ -1,13 +1,63 @@
 import argparse
 import time
-import matplotlib.pyplot as plt
 from DynamicMaze import DynamicMaze
+from MazeGenerator import MazeGenerator
+from Simulation import Simulation
+from RasterRenderer import RasterRenderer
+from FrameWriter import FrameWriter
+from Stats import Stats
 
-def main(rows, cols, pawnSpeed, updateFactor):
+def reportStats(stats, path):
+    # Print the per-phase breakdown and write it as JSON if a path is given.
+    print(stats.report())
+    if path:
+        stats.dump(path)
+        print(f"Wrote the profile to {path}.")
+
+def main(rows, cols, pawnSpeed, updateFactor, planner, generator, seed, updateMode, headless=False, ticks=None,
+         record=None, cellSize=8, historyCapacity=None, pawns=1, profile=None):
+
+    # Record timers and counters of every phase if asked, before anything is generated.
+    stats = Stats.enable() if profile is not None else None
+
+    # Initialize the simulation of the dynamic maze.
+    simulation = Simulation(rows, cols, pawnSpeed, updateFactor, planner, generator, seed, updateMode, ticks, historyCapacity, pawns)
+    dynamicMaze = simulation.dynamicMaze
+    print(f"Generated a {rows}x{cols} maze with {generator} in {dynamicMaze.generationTime:.3f} s (seed {dynamicMaze.seed}).")
+
+    # Record every tick offscreen if asked, as raw video for a .rgb or .raw path and as PNG files otherwise.
+    frameWriter = None
+    if record is not None:
+        rasterRenderer = RasterRenderer(rows, cols, cellSize)
+        frameWriter = FrameWriter(record, 'raw' if record.endswith(('.rgb', '.raw')) else 'png')
+        frameWriter.write(rasterRenderer.render(dynamicMaze))
+
+    if headless:
+        # Run without a display and report the throughput.
+        startTime = time.perf_counter()
+        if frameWriter is None:
+            reachedGoal = simulation.runUntilGoal()
+        else:
+            while simulation.step():
+                frameWriter.write(rasterRenderer.render(dynamicMaze))
+            reachedGoal = simulation.reachedGoal()
+        elapsed = time.perf_counter() - startTime
+        print(f"Ran {simulation.ticks} ticks in {elapsed:.3f} s ({simulation.ticks / max(elapsed, 1e-9):.0f} ticks/s).")
+        if reachedGoal:
+            print(f"The {'pawns' if pawns > 1 else 'pawn'} reached the {'goals' if pawns > 1 else 'goal'} after {simulation.ticks} ticks.")
+        else:
+            print(f"The {'pawns' if pawns > 1 else 'pawn'} did not reach the {'goals' if pawns > 1 else 'goal'} within {simulation.ticks} ticks.")
+        print(f"Replans performed: {dynamicMaze.replansPerformed}, skipped: {dynamicMaze.replansSkipped}.")
+        if frameWriter is not None:
+            frameWriter.close()
+            height, width, _ = rasterRenderer.frame.shape
+            print(f"Wrote {frameWriter.framesWritten} frames of {width}x{height} pixels to {record}.")
+        if stats is not None:
+            reportStats(stats, profile)
+        return
+
+    import matplotlib.pyplot as plt
 
-    # Initialize dynamic maze.
-    dynamicMaze = DynamicMaze(rows, cols)
-    
     # Plot the initial maze.
     dynamicMaze.plot()
 
@@ -15,29 +65,26 @@ def main(rows, cols, pawnSpeed, updateFactor):
     figManager.window.state('zoomed')
     # Add a small pause for the windws to be arranged.
     plt.pause(1)
-    
-    # Normalize pawn speed to ensure it's between 0 and 1.
-    pawnSpeed = max(0.0000001, min(1, pawnSpeed))
-    
-    # Normalize update factor to ensure it's greater than or equal to 1.
-    updateFactor = max(0, updateFactor)
-
-    # Calculate the number of cycles between each movement based on pawn speed
-    cyclesPerMove = int(1 / pawnSpeed)
-
-    counter = 0
-    while True:
+
+    while not simulation.isFinished():
         # Update maze and move pawn every cyclesPerMove cycles. Plot the resulting
         # maze and panws position after each update.
-        dynamicMaze.updateMaze(updateFactor)
-        counter += 1
-        if counter % cyclesPerMove == 0:
-            dynamicMaze.pawn.move()
+        simulation.step()
         dynamicMaze.plot()
+        if frameWriter is not None:
+            frameWriter.write(rasterRenderer.render(dynamicMaze))
 
         # Pause briefly to control the simulation speed.
         time.sleep(0.01)
 
+    if frameWriter is not None:
+        frameWriter.close()
+    if stats is not None:
+        reportStats(stats, profile)
+
+    # Keep the window open after the run is over.
+    plt.show()
+
 if __name__ == "__main__":
     # Parse command-line arguments.
     parser = argparse.ArgumentParser(description='Dynamic Maze Solver')
@@ -45,7 +92,19 @@ if __name__ == "__main__":
     parser.add_argument('--cols', type=int, default=12, help='Number of columns in the maze')
     parser.add_argument('--pawnSpeed', type=float, default=0.33333, help='Speed of the pawn')
     parser.add_argument('--updateFactor', type=int, default=5, help='Factor of the updates')
+    parser.add_argument('--planner', choices=['astar', 'incremental', 'field'], default='astar', help='Path planner of the pawn')
+    parser.add_argument('--generator', choices=list(MazeGenerator.ALGORITHMS), default='prim', help='Maze generation algorithm')
+    parser.add_argument('--updateMode', choices=list(DynamicMaze.UPDATE_MODES), default='sequential', help='Apply and replan after every wall change, or apply all changes of an update at once')
+    parser.add_argument('--seed', type=int, default=None, help='Root seed of the run, random if not given')
+    parser.add_argument('--headless', action='store_true', help='Run without a display and print the throughput')
+    parser.add_argument('--ticks', type=int, default=None, help='Maximum number of updates, unlimited if not given')
+    parser.add_argument('--record', default=None, help='Record every update offscreen, into a raw rgb24 video for a .rgb or .raw path and into a directory of PNG files otherwise')
+    parser.add_argument('--cellSize', type=int, default=8, help='Size of a cell in pixels in the recording')
+    parser.add_argument('--pawns', type=int, default=1, help='Number of pawns, the ones after the first get random starts and goals')
+    parser.add_argument('--historyCapacity', type=int, default=None, help='Maximum number of positions kept in the move history, unlimited if not given')
+    parser.add_argument('--profile', nargs='?', const='', default=None, help='Print the time and counters of every phase at the end of the run, and write them as JSON if a path is given')
     args = parser.parse_args()
 
     # Call main function with parsed arguments.
-    main(args.rows, args.cols, args.pawnSpeed, args.updateFactor)
+    main(args.rows, args.cols, args.pawnSpeed, args.updateFactor, args.planner, args.generator, args.seed, args.updateMode,
+         args.headless, args.ticks, args.record, args.cellSize, args.historyCapacity, args.pawns, args.profile)